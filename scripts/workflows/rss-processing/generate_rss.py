@@ -8,14 +8,15 @@ import argparse
 import json
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from xml.etree import ElementTree as ET
+from itertools import chain, repeat
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
 
 from utils import (
     generate_feed_slug,
+    get_published_sort_key,
     parse_iso_timestamp,
     resolve_site_metadata,
-    sort_articles_by_date,
+    write_file_bytes,
 )
 
 # Default base URL - can be overridden via environment variable or CLI argument
@@ -31,6 +32,41 @@ if not DEFAULT_BASE_URL.startswith("http"):
     DEFAULT_BASE_URL = f"https://{DEFAULT_BASE_URL}"
 
 
+# RFC 822 day and month names are fixed English abbreviations, so format them
+# from lookup tables rather than going through locale-dependent strftime
+RFC822_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+RFC822_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+def _format_rfc822_datetime(dt: datetime) -> str:
+    """
+    Format a datetime as an RFC 822 string with a fixed +0000 offset.
+
+    Args:
+            dt: datetime to format
+
+    Returns:
+            RFC 822 formatted date string
+    """
+    return (
+        f"{RFC822_WEEKDAYS[dt.weekday()]}, {dt.day:02d} {RFC822_MONTHS[dt.month - 1]}"
+        f" {dt.year:04d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} +0000"
+    )
+
+
 def format_rfc822_date(iso_date_str: str) -> str:
     """
     Format ISO 8601 date string to RFC 822 format required by RSS 2.0.
@@ -43,15 +79,123 @@ def format_rfc822_date(iso_date_str: str) -> str:
     """
     try:
         dt = parse_iso_timestamp(iso_date_str)
-        # RFC 822 format: "Day, DD Mon YYYY HH:MM:SS +0000"
-        return dt.strftime("%a, %d %b %Y %H:%M:%S +0000")
     except (ValueError, AttributeError):
         # If parsing fails, return current time
-        return datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0000")
+        dt = datetime.now()
+    # RFC 822 format: "Day, DD Mon YYYY HH:MM:SS +0000"
+    return _format_rfc822_datetime(dt)
+
+
+def escape_xml_text(text: str) -> str:
+    """
+    Escape a string for use as XML character data.
+
+    Args:
+            text: Raw text content
+
+    Returns:
+            Text with &, < and > escaped
+    """
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def escape_xml_attribute(value: str) -> str:
+    """
+    Escape a string for use as a double-quoted XML attribute value.
+
+    Args:
+            value: Raw attribute value
+
+    Returns:
+            Attribute value with markup characters and whitespace escaped
+    """
+    return (
+        escape_xml_text(value)
+        .replace('"', "&quot;")
+        .replace("\r", "&#13;")
+        .replace("\n", "&#10;")
+        .replace("\t", "&#09;")
+    )
+
+
+def _xml_text_element(tag: str, text: Optional[str], indent: str) -> str:
+    """
+    Render a single indented XML element that only contains text.
+
+    Args:
+            tag: Element tag name
+            text: Element text (empty elements are self-closed)
+            indent: Leading whitespace for the element
+
+    Returns:
+            XML element string terminated by a newline
+    """
+    if not text:
+        return f"{indent}<{tag} />\n"
+    return f"{indent}<{tag}>{escape_xml_text(text)}</{tag}>\n"
+
+
+class Article(NamedTuple):
+    """
+    Lightweight article record used while sorting and serializing RSS items.
+    """
+
+    title: Optional[str]
+    link: str
+    published: Optional[str]
+    source: Optional[str] = None
+    # Whether a <source> element is written, even when source is None
+    has_source: bool = False
+
+    @classmethod
+    def from_dict(
+        cls, article: Dict[str, Any], source: Optional[str] = None
+    ) -> "Article":
+        """
+        Build an article record from a collected article dictionary.
+
+        Args:
+                article: Article dictionary with title, link, published
+                source: Source feed name (defaults to the article's own 'source')
+
+        Returns:
+                Article record
+        """
+        # A 'source' key set to None still produces an empty source element
+        has_source = source is not None or "source" in article
+        return cls(
+            article.get("title", "No title"),
+            article.get("link", ""),
+            article.get("published"),
+            source if source is not None else article.get("source"),
+            has_source,
+        )
+
+    def sort_key(self) -> datetime:
+        """
+        Get sort key for the article by publication date.
+
+        Returns:
+                datetime object for sorting (MIN_SORT_DATETIME if no valid date)
+        """
+        return get_published_sort_key(self.published)
+
+
+def sort_rss_articles(articles: Iterable[Article]) -> List[Article]:
+    """
+    Sort article records by publication date (newest first).
+
+    Args:
+            articles: Article records to sort
+
+    Returns:
+            Sorted list of article records
+    """
+    return sorted(articles, key=Article.sort_key, reverse=True)
 
 
 def create_rss_feed(
-    # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     title: str,
     link: str,
     description: str,
@@ -72,70 +216,96 @@ def create_rss_feed(
     Returns:
             RSS 2.0 XML string
     """
-    # Create RSS root element
-    rss = ET.Element("rss")
-    rss.set("version", "2.0")
-    rss.set("xmlns:atom", "http://www.w3.org/2005/Atom")
+    return build_rss_xml(
+        title,
+        link,
+        description,
+        [Article.from_dict(article) for article in articles],
+        last_build_date,
+        generator_name,
+    )
 
-    # Create channel element
-    channel = ET.SubElement(rss, "channel")
 
-    # Add channel metadata
-    title_elem = ET.SubElement(channel, "title")
-    title_elem.text = title
+def build_rss_xml(
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    title: str,
+    link: str,
+    description: str,
+    articles: Iterable[Article],
+    last_build_date: str,
+    generator_name: str,
+) -> str:
+    """
+    Build RSS 2.0 XML from article records.
 
-    link_elem = ET.SubElement(channel, "link")
-    link_elem.text = link
+    The XML is written directly into a list of string fragments, producing the
+    same two-space indented output as ElementTree without building a DOM.
 
-    description_elem = ET.SubElement(channel, "description")
-    description_elem.text = description
+    Args:
+            title: Feed title
+            link: Feed link URL
+            description: Feed description
+            articles: Article records in output order
+            last_build_date: ISO 8601 timestamp of when feed was built
+            generator_name: Generator name for the channel
 
-    # Add atom:link for self-reference
-    atom_link = ET.SubElement(channel, "atom:link")
-    atom_link.set("href", link)
-    atom_link.set("rel", "self")
-    atom_link.set("type", "application/rss+xml")
+    Returns:
+            RSS 2.0 XML string
+    """
+    out = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">\n',
+        "  <channel>\n",
+    ]
+    append = out.append
+
+    # Add channel metadata
+    append(_xml_text_element("title", title, "    "))
+    append(_xml_text_element("link", link, "    "))
+    append(_xml_text_element("description", description, "    "))
 
-    # Add lastBuildDate
-    last_build_elem = ET.SubElement(channel, "lastBuildDate")
-    last_build_elem.text = format_rfc822_date(last_build_date)
+    # Add atom:link for self-reference
+    append(
+        f'    <atom:link href="{escape_xml_attribute(link)}" rel="self"'
+        ' type="application/rss+xml" />\n'
+    )
 
-    # Add generator
-    generator = ET.SubElement(channel, "generator")
-    generator.text = generator_name
+    # Add lastBuildDate and generator
+    append(
+        _xml_text_element("lastBuildDate", format_rfc822_date(last_build_date), "    ")
+    )
+    append(_xml_text_element("generator", generator_name, "    "))
 
     # Add items (articles)
     for article in articles:
-        item = ET.SubElement(channel, "item")
-
-        item_title = ET.SubElement(item, "title")
-        item_title.text = article.get("title", "No title")
-
-        item_link = ET.SubElement(item, "link")
-        item_link.text = article.get("link", "")
+        append("    <item>\n")
+        append(_xml_text_element("title", article.title, "      "))
+        article_link = article.link
+        append(_xml_text_element("link", article_link, "      "))
 
         # Add GUID (using link as identifier)
-        guid = ET.SubElement(item, "guid")
-        guid.set("isPermaLink", "true")
-        guid.text = article.get("link", "")
+        if article_link:
+            append(
+                '      <guid isPermaLink="true">'
+                f"{escape_xml_text(article_link)}</guid>\n"
+            )
+        else:
+            append('      <guid isPermaLink="true" />\n')
 
         # Add publication date if available
-        pub_date = article.get("published")
+        pub_date = article.published
         if pub_date and pub_date != "Unknown":
-            pub_date_elem = ET.SubElement(item, "pubDate")
-            pub_date_elem.text = format_rfc822_date(pub_date)
+            append(_xml_text_element("pubDate", format_rfc822_date(pub_date), "      "))
 
         # Add source feed name if available
-        if "source" in article:
-            source = ET.SubElement(item, "source")
-            source.text = article["source"]
+        if article.has_source:
+            append(_xml_text_element("source", article.source, "      "))
 
-    # Convert to string with XML declaration
-    tree = ET.ElementTree(rss)
-    ET.indent(tree, space="  ")
-    xml_str = ET.tostring(rss, encoding="unicode")
+        append("    </item>\n")
 
-    return '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_str
+    append("  </channel>\n</rss>")
+
+    return "".join(out)
 
 
 def generate_master_feed(
@@ -157,20 +327,17 @@ def generate_master_feed(
         base_url = DEFAULT_BASE_URL
     metadata = resolve_site_metadata(site_metadata)
 
-    # Collect all articles from all feeds
-    all_articles = []
-    for feed_name, feed_data in data["feeds"].items():
-        for article in feed_data["articles"]:
-            # Add source feed name to article
-            article_with_source = article.copy()
-            article_with_source["source"] = feed_name
-            all_articles.append(article_with_source)
-
-    # Sort by publication date (newest first)
-    all_articles = sort_articles_by_date(all_articles)
+    # Collect all articles from all feeds, tagged with their source feed name,
+    # sorted by publication date (newest first)
+    all_articles = sort_rss_articles(
+        chain.from_iterable(
+            map(Article.from_dict, feed_data["articles"], repeat(feed_name))
+            for feed_name, feed_data in data["feeds"].items()
+        )
+    )
 
     # Generate RSS feed
-    return create_rss_feed(
+    return build_rss_xml(
         title=metadata["rss_title"],
         link=f"{base_url}/feed.xml",
         description=metadata["rss_description"],
@@ -206,9 +373,11 @@ def generate_individual_feed(
     feed_slug = generate_feed_slug(feed_name)
 
     # Sort articles by publication date (newest first)
-    sorted_articles = sort_articles_by_date(feed_data["articles"])
+    sorted_articles = sort_rss_articles(
+        Article.from_dict(article) for article in feed_data["articles"]
+    )
 
-    return create_rss_feed(
+    return build_rss_xml(
         title=f"{metadata['site_name']} - {feed_name}",
         link=f"{base_url}/feed-{feed_slug}.xml",
         description=f"Articles from {feed_name}",
@@ -241,8 +410,7 @@ def generate_all_feeds(
     master_feed_path = os.path.join(output_dir, "feed.xml")
     metadata = resolve_site_metadata(site_metadata)
     master_feed_xml = generate_master_feed(data, base_url, metadata)
-    with open(master_feed_path, "w", encoding="utf-8") as f:
-        f.write(master_feed_xml)
+    write_file_bytes(master_feed_path, master_feed_xml.encode("utf-8"))
     print(f"✓ Master RSS feed written to {master_feed_path}")
 
     # Generate individual feeds
@@ -257,8 +425,7 @@ def generate_all_feeds(
             base_url,
             metadata,
         )
-        with open(feed_path, "w", encoding="utf-8") as f:
-            f.write(feed_xml)
+        write_file_bytes(feed_path, feed_xml.encode("utf-8"))
         print(f"✓ RSS feed for '{feed_name}' written to {feed_path}")
 
 
@@ -5,14 +5,19 @@ Generates both markdown (for GitHub workflow summary) and HTML (for GitHub Pages
 """
 
 import argparse
+import io
 import json
 import os
+import re
 import shutil
+from functools import lru_cache
 from html import escape as html_escape
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
 from utils import (
+    atomic_text_writer,
     generate_feed_slug,
     load_site_metadata,
     parse_iso_timestamp,
@@ -31,6 +36,17 @@ STATIC_SITE_FILES = (
     "styles.css",
 )
 
+# Buffer size for streaming generated pages to disk
+PAGE_WRITE_BUFFER = 64 * 1024
+
+# Page placeholders filled per page; the stylesheet link is matched before the
+# plain timestamp placeholder so it receives the cache-busting version
+STYLESHEET_VERSION_PLACEHOLDER = 'href="styles.css?v=<!-- TIMESTAMP_PLACEHOLDER -->"'
+PAGE_PLACEHOLDER_PATTERN = re.compile(
+    f"({re.escape(STYLESHEET_VERSION_PLACEHOLDER)}"
+    "|<!-- (?:CONTENT|SIDEBAR|TIMESTAMP)_PLACEHOLDER -->)"
+)
+
 
 def get_repo_root() -> Path:
     """
@@ -71,126 +87,190 @@ def get_template_path() -> Path:
 
 
 STATIC_SITE_DIR = get_static_site_dir()
+TEMPLATE_PATH = str(get_template_path())
 
 
-def generate_markdown_summary(
-    data: Dict[str, Any], site_metadata: Optional[Dict[str, str]] = None
-) -> str:
+def truncate_title(title: str, limit: int = 80) -> str:
     """
-    Generate markdown summary from RSS feed collection data
+    Shorten an article title for the markdown summary table
 
     Args:
-        data: RSS feed collection data dictionary
+        title: Article title
+        limit: Maximum number of title characters kept
 
     Returns:
-        Markdown formatted string
+        Title cut to limit characters with "..." appended, or unchanged if it fits
+    """
+    return title if len(title) <= limit else title[:limit] + "..."
+
+
+def write_markdown_summary(
+    out: TextIO,
+    data: Dict[str, Any],
+    site_metadata: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Write markdown summary from RSS feed collection data to a text stream
+
+    Args:
+        out: Text stream to write the markdown to
+        data: RSS feed collection data dictionary
+        site_metadata: Optional site metadata overrides
     """
     metadata = resolve_site_metadata(site_metadata)
-    summary = []
-    summary.append(f"{metadata['summary_markdown_title']}\n")
-    summary.append(f"**Collected at:** {data['metadata']['collected_at']}\n")
+    print(f"{metadata['summary_markdown_title']}\n", file=out)
+    print(f"**Collected at:** {data['metadata']['collected_at']}\n", file=out)
     hours = data["metadata"].get("hours", 24)
-    summary.append(f"**Time range:** Last {hours} hours\n")
-    summary.append(
-        "**Note:** Web interface provides filtering for 1 day, 3 days, 7 days, 30 days, or 1 year\n"
+    print(f"**Time range:** Last {hours} hours\n", file=out)
+    print(
+        "**Note:** Web interface provides filtering for "
+        "1 day, 3 days, 7 days, 30 days, or 1 year\n",
+        file=out,
     )
-    summary.append("")
+    print(file=out)
 
     # Overall summary
-    summary.append("## 📊 Summary\n")
-    summary.append(f"- **Total feeds:** {data['summary']['total_feeds']}")
-    summary.append(f"- **Successful:** {data['summary']['successful_feeds']}")
-    summary.append(f"- **Failed:** {data['summary']['failed_feeds']}")
-    summary.append(f"- **Total articles:** {data['summary']['total_articles']}")
-    summary.append("")
+    print("## 📊 Summary\n", file=out)
+    print(f"- **Total feeds:** {data['summary']['total_feeds']}", file=out)
+    print(f"- **Successful:** {data['summary']['successful_feeds']}", file=out)
+    print(f"- **Failed:** {data['summary']['failed_feeds']}", file=out)
+    print(f"- **Total articles:** {data['summary']['total_articles']}", file=out)
 
+    # Sections are separated by blank lines, with no trailing blank line
     # Successful feeds
     if data["feeds"]:
-        summary.append("## ✅ Successful Feeds\n")
-        for feed_name, feed_data in data["feeds"].items():
-            summary.append(f"### {feed_name}")
-            summary.append(f"- **Articles:** {feed_data['count']}")
+        print(file=out)
+        print("## ✅ Successful Feeds\n", file=out)
+        for index, (feed_name, feed_data) in enumerate(data["feeds"].items()):
+            if index:
+                print(file=out)
+            print(f"### {feed_name}", file=out)
+            print(f"- **Articles:** {feed_data['count']}", file=out)
 
             if feed_data["articles"]:
-                summary.append("\n| Title | Published |")
-                summary.append("|-------|-----------|")
-                for article in feed_data["articles"][:10]:  # Limit to first 10
-                    title = (
-                        article["title"][:80] + "..."
-                        if len(article["title"]) > 80
-                        else article["title"]
-                    )
+                print("\n| Title | Published |", file=out)
+                print("|-------|-----------|", file=out)
+                # Limit to first 10
+                for article in islice(feed_data["articles"], 10):
+                    title = truncate_title(article["title"])
                     published = article["published"]
-                    summary.append(f"| [{title}]({article['link']}) | {published} |")
+                    print(f"| [{title}]({article['link']}) | {published} |", file=out)
 
                 if feed_data["count"] > 10:
-                    summary.append(
-                        f"\n*...and {feed_data['count'] - 10} more articles*"
+                    print(
+                        f"\n*...and {feed_data['count'] - 10} more articles*", file=out
                     )
             else:
-                summary.append("*No new articles*")
-
-            summary.append("")
+                print("*No new articles*", file=out)
 
     # Failed feeds
     if data["failed_feeds"]:
-        summary.append("## ❌ Failed Feeds\n")
-        summary.append("| Feed Name | URL | Error |")
-        summary.append("|-----------|-----|-------|")
+        print(file=out)
+        print("## ❌ Failed Feeds\n", file=out)
+        print("| Feed Name | URL | Error |", file=out)
+        print("|-----------|-----|-------|", file=out)
         for failed in data["failed_feeds"]:
             error_reason = failed.get("error", "Unknown")
-            summary.append(f"| {failed['name']} | {failed['url']} | {error_reason} |")
-        summary.append("")
-
-    return "\n".join(summary)
+            print(f"| {failed['name']} | {failed['url']} | {error_reason} |", file=out)
 
 
-def generate_feed_nav(
-    feeds: Dict[str, Any],
-    current_feed: Optional[str] = None,
+def generate_markdown_summary(
+    data: Dict[str, Any], site_metadata: Optional[Dict[str, str]] = None
 ) -> str:
     """
-    Generate navigation links for feed pages (for sidebar)
+    Generate markdown summary from RSS feed collection data
 
     Args:
-        feeds: Dictionary of feed data
-        current_feed: Name of current feed (if on a feed page), "failed" for failed feeds page,
-                     or "summary" for summary page
+        data: RSS feed collection data dictionary
 
     Returns:
-        HTML navigation string
+        Markdown formatted string
+    """
+    out = io.StringIO()
+    write_markdown_summary(out, data, site_metadata)
+    return out.getvalue()
+
+
+# Navigation entry: (current_feed value that marks it active, prefix, suffix)
+NavEntry = Tuple[Optional[str], str, str]
+
+
+@lru_cache(maxsize=32)
+def _build_nav_skeleton(
+    feed_names: Tuple[str, ...],
+) -> Tuple[str, Tuple[NavEntry, ...]]:
     """
+    Build the parts of the feed navigation that do not depend on the current page
+
+    Cached because every generated page shares the same navigation and only
+    differs in which link carries the active class. The names are sorted here,
+    so the sort only runs on a cache miss rather than once per page.
+
+    Args:
+        feed_names: Feed names in data order
+
+    Returns:
+        Tuple of the navigation header HTML and the link entries
+    """
+    sorted_names = sorted(feed_names)
+
     # Create a hidden element with feed names as JSON for settings page
     # Escape the JSON to prevent XSS in the script tag
-    feed_names = sorted(feeds.keys())
-    feed_list_json = json.dumps(feed_names)
+    feed_list_json = json.dumps(sorted_names)
     # HTML-escape the JSON content to prevent XSS when embedded in script tag
     escaped_feed_list_json = html_escape(feed_list_json)
 
-    nav_html = '<nav class="feed-nav" aria-label="Feed navigation">\n'
-    nav_html += '  <script type="application/json" '
-    nav_html += f'id="feed-list-data">{escaped_feed_list_json}</script>\n'
-    nav_html += '  <a href="index.html" class="nav-link'
-    if current_feed is None:
-        nav_html += " active"
-    nav_html += '">All Feeds</a>\n'
+    header = (
+        '<nav class="feed-nav" aria-label="Feed navigation">\n'
+        '  <script type="application/json" '
+        f'id="feed-list-data">{escaped_feed_list_json}</script>\n'
+    )
 
-    for feed_name in feed_names:
+    entries: List[NavEntry] = [
+        (None, '  <a href="index.html" class="nav-link', '">All Feeds</a>\n')
+    ]
+    for feed_name in sorted_names:
         feed_slug = generate_feed_slug(feed_name)
+        entries.append(
+            (
+                feed_name,
+                f'  <a href="feed-{feed_slug}.html" class="nav-link',
+                f'">{html_escape(feed_name)}</a>\n',
+            )
+        )
+    entries.append(
+        ("summary", '  <a href="summary.html" class="nav-link', '">Summary</a>\n')
+    )
 
-        nav_html += f'  <a href="feed-{feed_slug}.html" class="nav-link'
-        if current_feed == feed_name:
-            nav_html += " active"
-        nav_html += f'">{html_escape(feed_name)}</a>\n'
+    return header, tuple(entries)
 
-    nav_html += '  <a href="summary.html" class="nav-link'
-    if current_feed == "summary":
-        nav_html += " active"
-    nav_html += '">Summary</a>\n'
 
-    nav_html += "</nav>\n"
+def generate_feed_nav(
+    feeds: Dict[str, Any],
+    current_feed: Optional[str] = None,
+) -> str:
+    """
+    Generate navigation links for feed pages (for sidebar)
 
-    return nav_html
+    Args:
+        feeds: Dictionary of feed data
+        current_feed: Name of current feed (if on a feed page), "failed" for failed feeds page,
+                     or "summary" for summary page
+
+    Returns:
+        HTML navigation string
+    """
+    header, entries = _build_nav_skeleton(tuple(feeds))
+
+    nav_parts = [header]
+    for active_for, prefix, suffix in entries:
+        nav_parts.append(prefix)
+        if current_feed == active_for:
+            nav_parts.append(" active")
+        nav_parts.append(suffix)
+    nav_parts.append("</nav>\n")
+
+    return "".join(nav_parts)
 
 
 def generate_failed_feeds_content(failed_feeds: list) -> str:
@@ -203,34 +283,34 @@ def generate_failed_feeds_content(failed_feeds: list) -> str:
     Returns:
         HTML content string for failed feeds
     """
-    content = """
+    parts = ["""
         <h2>Failed Feeds</h2>
-"""
+"""]
     if failed_feeds:
-        content += """
+        parts.append("""
         <div class="failed-feeds">
-"""
+""")
         for failed in failed_feeds:
             escaped_name = html_escape(failed["name"])
             escaped_url = html_escape(failed["url"])
             # Get error reason, default to "Unknown" if not present
             error_reason = failed.get("error", "Unknown")
             escaped_error = html_escape(error_reason)
-            content += f"""
+            parts.append(f"""
             <div class="failed-feed-item">
                 <div class="failed-feed-name">{escaped_name}</div>
                 <div class="failed-feed-url">{escaped_url}</div>
                 <div class="failed-feed-error">Error: {escaped_error}</div>
             </div>
-"""
-        content += """
+""")
+        parts.append("""
         </div>
-"""
+""")
     else:
-        content += """
+        parts.append("""
         <div class="no-articles">No failed feeds</div>
-"""
-    return content
+""")
+    return "".join(parts)
 
 
 def format_publish_date(iso_date_str: str) -> str:
@@ -376,7 +456,7 @@ def generate_feed_articles_content(feeds_to_display: Dict[str, Any]) -> str:
     if not feeds_to_display:
         return ""
 
-    content = ""
+    parts = []
     for feed_name, feed_data in feeds_to_display.items():
         article_count = feed_data["count"]
         escaped_feed_name = html_escape(feed_name)
@@ -390,43 +470,49 @@ def generate_feed_articles_content(feeds_to_display: Dict[str, Any]) -> str:
             )
         else:
             title_html = escaped_feed_name
-        content += f"""
+        parts.append(f"""
         <div class="feed-section">
             <h2>{title_html}
                 <span class="feed-count">
                     {article_count} article{article_plural}
                 </span>
             </h2>
-"""
+""")
         if feed_data["articles"]:
-            content += """
+            parts.append("""
             <ul class="article-list">
-"""
+""")
             for article in feed_data["articles"]:
                 escaped_title = html_escape(article["title"])
                 escaped_link = html_escape(article["link"])
-                formatted_date = format_publish_date(article["published"])
-                iso_timestamp = html_escape(article["published"])
-                content += f"""
+                published = article["published"]
+                iso_timestamp = html_escape(published)
+                formatted_date = format_publish_date(published)
+                # Parsed dates contain no markup characters; unparsable ones
+                # are passed through unchanged and reuse the escaped timestamp
+                escaped_date = (
+                    iso_timestamp if formatted_date == published else formatted_date
+                )
+                parts.append(f"""
                 <li class="article-item" data-published="{iso_timestamp}">
                     <a href="{escaped_link}" class="article-title"
                        target="_blank" rel="noopener noreferrer">
                         {escaped_title}
                     </a>
-                    <div class="article-meta">{html_escape(formatted_date)}</div>
+                    <div class="article-meta">{escaped_date}</div>
                 </li>
-"""
-            content += """
+""")
+            parts.append("""
             </ul>
-"""
+""")
         else:
-            content += """
+            parts.append("""
             <div class="no-articles">No new articles in this time period</div>
-"""
-        content += """
+""")
+        parts.append("""
         </div>
-"""
-    return content
+""")
+    return "".join(parts)
 
 
 def generate_html_content(
@@ -443,15 +529,14 @@ def generate_html_content(
     Returns:
         HTML content string to be injected into template
     """
-    content = ""
-
     # If showing summary page
     if current_feed == "summary":
+        parts = []
         failed_icon_path = (
             "M10.29 3.86L1.82 18a2 2 0 0 0 1.71 3h16.94a2 2 0 0 0 1.71-3"
             "L13.71 3.86a2 2 0 0 0-3.42 0z"
         )
-        content += """
+        parts.append("""
         <h2>Feed Collection Summary</h2>
         <div class="summary-intro">
             Overview of RSS feed collection status and statistics.
@@ -475,9 +560,9 @@ def generate_html_content(
                     </svg>
                 </div>
                 <div class="stat-label">Total Feeds</div>
-                <div class="stat-value">"""
-        content += f"{data['summary']['total_feeds']}"
-        content += """</div>
+                <div class="stat-value">""")
+        parts.append(f"{data['summary']['total_feeds']}")
+        parts.append("""</div>
             </div>
             <div class="stat-card success">
                 <div class="stat-icon">
@@ -496,9 +581,9 @@ def generate_html_content(
                     </svg>
                 </div>
                 <div class="stat-label">Successful</div>
-                <div class="stat-value">"""
-        content += f"{data['summary']['successful_feeds']}"
-        content += f"""</div>
+                <div class="stat-value">""")
+        parts.append(f"{data['summary']['successful_feeds']}")
+        parts.append(f"""</div>
             </div>
             <div class="stat-card error">
                 <div class="stat-icon">
@@ -518,9 +603,9 @@ def generate_html_content(
                     </svg>
                 </div>
                 <div class="stat-label">Failed</div>
-                <div class="stat-value">"""
-        content += f"{data['summary']['failed_feeds']}"
-        content += """</div>
+                <div class="stat-value">""")
+        parts.append(f"{data['summary']['failed_feeds']}")
+        parts.append("""</div>
             </div>
             <div class="stat-card">
                 <div class="stat-icon">
@@ -540,37 +625,37 @@ def generate_html_content(
                     </svg>
                 </div>
                 <div class="stat-label">Total Articles</div>
-                <div class="stat-value">"""
-        content += f"{data['summary']['total_articles']}"
-        content += """</div>
+                <div class="stat-value">""")
+        parts.append(f"{data['summary']['total_articles']}")
+        parts.append("""</div>
             </div>
         </div>
-"""
+""")
         # Add failed feeds section to summary page
         if data.get("failed_feeds"):
-            content += generate_failed_feeds_content(data.get("failed_feeds", []))
+            parts.append(generate_failed_feeds_content(data.get("failed_feeds", [])))
 
         # Add feed breakdown section
         if data.get("feeds"):
-            content += """
+            parts.append("""
         <h2>Feed Breakdown</h2>
         <div class="feed-breakdown">
-"""
+""")
             # Sort feeds by article count (descending)
             sorted_feeds = sorted(
                 data["feeds"].items(), key=lambda x: x[1]["count"], reverse=True
             )
 
+            total_articles = data["summary"]["total_articles"]
             for feed_name, feed_data in sorted_feeds:
                 escaped_name = html_escape(feed_name)
                 article_count = feed_data["count"]
-                total_articles = data["summary"]["total_articles"]
                 percentage = (
                     (article_count / total_articles * 100) if total_articles > 0 else 0
                 )
                 feed_slug = generate_feed_slug(feed_name)
 
-                content += f"""
+                parts.append(f"""
             <div class="feed-breakdown-item">
                 <div class="feed-breakdown-header">
                     <a href="feed-{feed_slug}.html" class="feed-breakdown-name">
@@ -582,17 +667,16 @@ def generate_html_content(
                     <div class="feed-breakdown-fill" style="width: {percentage:.1f}%"></div>
                 </div>
             </div>
-"""
-            content += """
+""")
+            parts.append("""
         </div>
-"""
+""")
 
-        return content
+        return "".join(parts)
 
     # If showing failed feeds page (deprecated - now part of summary)
     if current_feed == "failed":
-        content += generate_failed_feeds_content(data.get("failed_feeds", []))
-        return content
+        return generate_failed_feeds_content(data.get("failed_feeds", []))
 
     # Determine which feeds to display
     feeds_to_display = {}
@@ -617,42 +701,50 @@ def generate_html_content(
         feeds_to_display.update(dict(sorted(empty_feeds.items())))
 
     # Display feeds
-    content += generate_feed_articles_content(feeds_to_display)
+    return generate_feed_articles_content(feeds_to_display)
 
-    return content
 
+@lru_cache(maxsize=8)
+def _read_template(template_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a template file, cached by its path, modification time and size.
 
-def generate_html_page(
-    data: Dict[str, Any],
-    template_path: Optional[str] = None,
-    current_feed: Optional[str] = None,
-    site_metadata: Optional[Dict[str, str]] = None,
-) -> str:
+    Args:
+        template_path: Path to the template file.
+        mtime_ns: Modification time of the file, used to invalidate the cache.
+        size: File size, used to invalidate the cache.
+
+    Returns:
+        Template file content.
     """
-    Generate complete HTML page from RSS feed collection data using template.
+    # pylint: disable=unused-argument
+    with open(template_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def load_template(template_path: str) -> str:
+    """
+    Load an HTML template, reusing the cached content while the file is unchanged.
+
+    Every page of a site build uses the same template, so it is only read from
+    disk again when its modification time or size changes.
 
     Args:
-        data: RSS feed collection data dictionary.
-        template_path: Path to HTML template file (optional).
-        current_feed: If specified, generate page for only this feed.
+        template_path: Path to the HTML template file.
 
     Returns:
-        Complete HTML page string.
+        Template file content.
 
     Raises:
-        FileNotFoundError: If the specified template file does not exist.
-        IOError: If an I/O error occurs while reading the template file.
-        OSError: If a path-related or other OS-level error occurs when
-            accessing the template file.
+        FileNotFoundError: If the template file does not exist.
+        OSError: If the template file cannot be read.
     """
-    # Get template path
-    if template_path is None:
-        template_path = str(get_template_path())
-
     # Read template with error handling and explicit UTF-8 encoding
     try:
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
+        stat_result = os.stat(template_path)
+        return _read_template(
+            template_path, stat_result.st_mtime_ns, stat_result.st_size
+        )
     except FileNotFoundError as exc:
         raise FileNotFoundError(
             f"HTML template file not found at '{template_path}'. "
@@ -663,13 +755,37 @@ def generate_html_page(
             f"Error reading HTML template file at '{template_path}': {exc}"
         ) from exc
 
-    metadata = resolve_site_metadata(site_metadata)
 
-    # Generate content
-    content = generate_html_content(data, current_feed)
+def write_html_page(
+    out: TextIO,
+    data: Dict[str, Any],
+    template_path: Optional[str] = None,
+    current_feed: Optional[str] = None,
+    site_metadata: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Render an HTML page from RSS feed collection data directly into a stream.
 
-    # Generate sidebar navigation
-    sidebar_content = generate_feed_nav(data["feeds"], current_feed)
+    Template segments and generated sections are written to the stream one by
+    one, so the complete page is never assembled as a separate string.
+
+    Args:
+        out: Text stream to write the page to.
+        data: RSS feed collection data dictionary.
+        template_path: Path to HTML template file (optional).
+        current_feed: If specified, generate page for only this feed.
+        site_metadata: Optional site metadata overrides.
+
+    Raises:
+        FileNotFoundError: If the specified template file does not exist.
+        OSError: If the template file cannot be read.
+    """
+    # Get template path
+    if template_path is None:
+        template_path = TEMPLATE_PATH
+
+    template = load_template(template_path)
+    metadata = resolve_site_metadata(site_metadata)
 
     # Get formatted timestamp
     collected_time = parse_iso_timestamp(data["metadata"]["collected_at"])
@@ -686,22 +802,52 @@ def generate_html_page(
     elif current_feed:
         page_title = f"{current_feed} - {metadata['site_name']}"
 
-    # Replace placeholders
     html = render_site_metadata_placeholders(
         template,
         metadata,
         page_title=page_title,
         page_description=metadata["site_description"],
     )
-    html = html.replace("<!-- CONTENT_PLACEHOLDER -->", content)
-    html = html.replace("<!-- SIDEBAR_PLACEHOLDER -->", sidebar_content)
-    html = html.replace("<!-- TIMESTAMP_PLACEHOLDER -->", formatted_time)
-    # Replace timestamp in CSS link for cache busting
-    html = html.replace(
-        'href="styles.css?v=<!-- TIMESTAMP_PLACEHOLDER -->"',
-        f'href="styles.css?v={cache_version}"',
-    )
-    return html
+
+    sections = {
+        "<!-- CONTENT_PLACEHOLDER -->": generate_html_content(data, current_feed),
+        "<!-- SIDEBAR_PLACEHOLDER -->": generate_feed_nav(data["feeds"], current_feed),
+        "<!-- TIMESTAMP_PLACEHOLDER -->": formatted_time,
+        # Replace timestamp in CSS link for cache busting
+        STYLESHEET_VERSION_PLACEHOLDER: f'href="styles.css?v={cache_version}"',
+    }
+
+    # re.split alternates literal template text and matched placeholders
+    for index, segment in enumerate(PAGE_PLACEHOLDER_PATTERN.split(html)):
+        out.write(sections[segment] if index % 2 else segment)
+
+
+def generate_html_page(
+    data: Dict[str, Any],
+    template_path: Optional[str] = None,
+    current_feed: Optional[str] = None,
+    site_metadata: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    Generate complete HTML page from RSS feed collection data using template.
+
+    Args:
+        data: RSS feed collection data dictionary.
+        template_path: Path to HTML template file (optional).
+        current_feed: If specified, generate page for only this feed.
+
+    Returns:
+        Complete HTML page string.
+
+    Raises:
+        FileNotFoundError: If the specified template file does not exist.
+        IOError: If an I/O error occurs while reading the template file.
+        OSError: If a path-related or other OS-level error occurs when
+            accessing the template file.
+    """
+    out = io.StringIO()
+    write_html_page(out, data, template_path, current_feed, site_metadata)
+    return out.getvalue()
 
 
 def generate_all_pages(
@@ -724,31 +870,28 @@ def generate_all_pages(
     os.makedirs(output_dir, exist_ok=True)
     copy_static_site_assets(output_dir, metadata)
 
+    # Sort feeds alphabetically once: feed pages are written in name order, and
+    # feeds with equal article counts are listed alphabetically on summary.html
+    data = {**data, "feeds": dict(sorted(data["feeds"].items()))}
+
     # Generate main index page (all feeds)
     index_path = os.path.join(output_dir, "index.html")
-    index_html = generate_html_page(data, site_metadata=metadata)
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(index_html)
+    with atomic_text_writer(index_path, buffering=PAGE_WRITE_BUFFER) as f:
+        write_html_page(f, data, site_metadata=metadata)
     print(f"✓ Main index page written to {index_path}")
 
     # Generate summary page
     summary_path = os.path.join(output_dir, "summary.html")
-    summary_html = generate_html_page(
-        data, current_feed="summary", site_metadata=metadata
-    )
-    with open(summary_path, "w", encoding="utf-8") as f:
-        f.write(summary_html)
+    with atomic_text_writer(summary_path, buffering=PAGE_WRITE_BUFFER) as f:
+        write_html_page(f, data, current_feed="summary", site_metadata=metadata)
     print(f"✓ Summary page written to {summary_path}")
 
     # Generate individual feed pages (sorted alphabetically)
-    for feed_name in sorted(data["feeds"].keys()):
+    for feed_name in data["feeds"]:
         feed_slug = generate_feed_slug(feed_name)
         feed_path = os.path.join(output_dir, f"feed-{feed_slug}.html")
-        feed_html = generate_html_page(
-            data, current_feed=feed_name, site_metadata=metadata
-        )
-        with open(feed_path, "w", encoding="utf-8") as f:
-            f.write(feed_html)
+        with atomic_text_writer(feed_path, buffering=PAGE_WRITE_BUFFER) as f:
+            write_html_page(f, data, current_feed=feed_name, site_metadata=metadata)
         print(f"✓ Feed page for '{feed_name}' written to {feed_path}")
 
 
@@ -808,9 +951,10 @@ def main():
 
     # Generate markdown if requested
     if args.markdown:
-        markdown_content = generate_markdown_summary(data, site_metadata)
-        with open(args.markdown, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
+        with open(
+            args.markdown, "w", encoding="utf-8", buffering=PAGE_WRITE_BUFFER
+        ) as f:
+            write_markdown_summary(f, data, site_metadata)
         print(f"✓ Markdown summary written to {args.markdown}")
 
     # Generate multi-page HTML if output directory is specified
@@ -4,10 +4,14 @@ Shared utilities for RSS feed collection and summary generation
 """
 
 import json
+import os
 import re
-from datetime import datetime
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Dict, Iterator, Optional, TextIO, Tuple
 
 DEFAULT_SITE_METADATA = {
     "site_name": "DevOps Feed Hub",
@@ -20,6 +24,15 @@ DEFAULT_SITE_METADATA = {
     "rss_generator": "DevOps Feed Hub RSS Generator",
 }
 
+# Slug patterns are compiled once since slugs are generated for every feed.
+# Invalid characters are anything but alphanumerics and hyphens ("_" is in \w)
+SLUG_INVALID_CHARS_PATTERN = re.compile(r"[^\w-]|_")
+SLUG_DASH_RUN_PATTERN = re.compile(r"-{2,}")
+
+# Sort key for articles without a usable date. It is timezone-aware like the
+# parsed "Z"/offset timestamps, since naive and aware datetimes cannot be compared
+MIN_SORT_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
 
 def apply_site_metadata_overrides(
     metadata: Dict[str, str], overrides: Optional[Dict[str, str]] = None
@@ -131,10 +144,14 @@ def resolve_site_metadata(
     return populate_derived_site_metadata(metadata)
 
 
+@lru_cache(maxsize=256)
 def generate_feed_slug(feed_name: str) -> str:
     """
     Generate a URL-safe slug from a feed name
 
+    Results are cached because the same feed names are slugged repeatedly
+    while generating navigation, pages, and RSS files.
+
     Args:
             feed_name: The feed name
 
@@ -143,9 +160,9 @@ def generate_feed_slug(feed_name: str) -> str:
     """
     feed_slug = feed_name.lower().replace(" ", "-").replace("/", "-")
     # Remove any other non-alphanumeric characters except hyphens
-    feed_slug = "".join(c if c.isalnum() or c == "-" else "" for c in feed_slug)
+    feed_slug = SLUG_INVALID_CHARS_PATTERN.sub("", feed_slug)
     # Collapse consecutive hyphens and remove leading/trailing ones
-    return re.sub(r"-{2,}", "-", feed_slug).strip("-")
+    return SLUG_DASH_RUN_PATTERN.sub("-", feed_slug).strip("-")
 
 
 def parse_iso_timestamp(iso_string: str) -> datetime:
@@ -161,36 +178,102 @@ def parse_iso_timestamp(iso_string: str) -> datetime:
     return datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
 
 
-def get_article_sort_key(article: Dict[str, Any]) -> datetime:
+def get_published_sort_key(pub_date: Optional[str]) -> datetime:
     """
-    Get sort key for article by publication date.
+    Get sort key for a publication date string.
 
     Args:
-        article: Article dictionary with 'published' field
+        pub_date: ISO 8601 publication date, "Unknown", or empty
 
     Returns:
-        datetime object for sorting (datetime.min if no valid date)
+        Timezone-aware datetime for sorting (MIN_SORT_DATETIME if no valid
+        date). Timestamps without an offset are treated as UTC.
     """
-    pub_date = article.get("published", "")
     if pub_date and pub_date != "Unknown":
         try:
-            return parse_iso_timestamp(pub_date)
+            parsed = parse_iso_timestamp(pub_date)
         except (ValueError, AttributeError):
-            return datetime.min
-    return datetime.min
+            return MIN_SORT_DATETIME
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=timezone.utc)
+        return parsed
+    return MIN_SORT_DATETIME
 
 
-def sort_articles_by_date(
-    articles: List[Dict[str, Any]], reverse: bool = True
-) -> List[Dict[str, Any]]:
+def _create_temp_file(path: str) -> Tuple[int, str]:
     """
-    Sort articles by publication date.
+    Create a temporary file next to path, to be renamed over it once written.
 
     Args:
-        articles: List of article dictionaries
-        reverse: If True, sort newest first (default)
+        path: Destination file path
 
     Returns:
-        Sorted list of articles
+        Tuple of the open file descriptor and the temporary file path
+    """
+    return tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".tmp")
+
+
+def _publish_temp_file(temp_path: str, path: str) -> None:
+    """
+    Make a completed temporary file world-readable and rename it over path.
+
+    Args:
+        temp_path: Fully written temporary file
+        path: Destination file path
+    """
+    # mkstemp creates owner-only files; published files must be readable
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, path)
+
+
+def write_file_bytes(path: str, payload: bytes) -> None:
+    """
+    Atomically write an encoded payload to a file with raw OS-level writes.
+
+    Skips the buffered text layer used by open(), since generated feeds are
+    already fully rendered in memory. The payload goes to a temporary file that
+    is renamed into place, so a failed write leaves the previous file intact.
+
+    Args:
+        path: Destination file path (created or replaced)
+        payload: Encoded file content
+    """
+    fd, temp_path = _create_temp_file(path)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        _publish_temp_file(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@contextmanager
+def atomic_text_writer(path: str, buffering: int = -1) -> Iterator[TextIO]:
+    """
+    Open a UTF-8 text stream whose content replaces path only once complete.
+
+    Content is written to a temporary file in the destination directory and
+    renamed into place on success, so readers never see a partially written
+    page and a failed render leaves the previous file untouched.
+
+    Args:
+        path: Destination file path
+        buffering: Buffer size passed to open()
+
+    Yields:
+        Writable text stream for the new file content
     """
-    return sorted(articles, key=get_article_sort_key, reverse=reverse)
+    fd, temp_path = _create_temp_file(path)
+    try:
+        with open(fd, "w", encoding="utf-8", buffering=buffering) as file:
+            yield file
+        _publish_temp_file(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
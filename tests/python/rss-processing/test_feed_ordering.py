@@ -8,8 +8,7 @@ feed ordering to ensure feeds with articles appear before empty feeds.
 import unittest
 from datetime import datetime, timedelta, timezone
 
-# pylint: disable=wrong-import-position
-from generate_summary import (  # noqa: E402
+from generate_summary import (
     generate_html_content,
     generate_html_page,
 )
@@ -18,10 +17,11 @@ from generate_summary import (  # noqa: E402
 class TestFeedOrdering(unittest.TestCase):
     """Test cases for feed ordering functionality"""
 
-    def setUp(self):
-        """Set up test data with mixed feed states"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared read-only test data with mixed feed states"""
         # Create test data with some feeds having articles and some empty
-        self.test_data = {
+        cls.test_data = {
             "metadata": {
                 "collection_time": "2026-01-07T23:00:00Z",
                 "hours_collected": 720,
@@ -59,10 +59,12 @@ class TestFeedOrdering(unittest.TestCase):
             },
             "failed_feeds": [],
         }
+        # Content rendered once and shared by the read-only assertions below
+        cls.test_html = generate_html_content(cls.test_data)
 
     def test_server_side_feed_ordering(self):
         """Test that Python code orders feeds correctly (feeds with articles first)"""
-        html = generate_html_content(self.test_data)
+        html = self.test_html
 
         # Find positions of each feed in the HTML
         github_pos = html.find("GitHub Blog")
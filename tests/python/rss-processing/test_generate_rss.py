@@ -6,10 +6,13 @@ Tests for RSS feed generator
 import json
 import os
 import tempfile
+from datetime import datetime
+from pathlib import Path
 from unittest.mock import patch
 from xml.etree import ElementTree as ET
 
-from generate_rss import (  # noqa: E402 # pylint: disable=wrong-import-position
+import pytest
+from generate_rss import (
     create_rss_feed,
     format_rfc822_date,
     generate_all_feeds,
@@ -18,9 +21,7 @@ from generate_rss import (  # noqa: E402 # pylint: disable=wrong-import-position
     main,
     parse_iso_timestamp,
 )
-from utils import (  # noqa: E402 # pylint: disable=wrong-import-position
-    generate_feed_slug,
-)
+from utils import generate_feed_slug
 
 
 def test_parse_iso_timestamp():
@@ -40,6 +41,27 @@ def test_format_rfc822_date():
     assert "12:00:00" in rfc_date
 
 
+def test_format_rfc822_date_matches_strftime_across_years():
+    """Test RFC 822 weekday and month lookup matches strftime output"""
+    for iso_date in (
+        "1999-12-31T23:59:59Z",
+        "2000-02-29T00:00:00Z",
+        "2024-03-05T07:08:09Z",
+        "2025-06-15T18:30:00Z",
+        "2026-01-10T12:00:00Z",
+        "2028-11-01T01:02:03Z",
+    ):
+        expected = parse_iso_timestamp(iso_date).strftime("%a, %d %b %Y %H:%M:%S +0000")
+        assert format_rfc822_date(iso_date) == expected
+
+
+def test_format_rfc822_date_invalid_input_uses_current_time():
+    """Test RFC 822 formatting falls back to current time on invalid input"""
+    rfc_date = format_rfc822_date("not-a-date")
+    assert rfc_date.endswith(" +0000")
+    assert str(datetime.now().year) in rfc_date
+
+
 def test_generate_feed_slug():
     """Test feed slug generation"""
     assert generate_feed_slug("Microsoft DevOps Blog") == "microsoft-devops-blog"
@@ -49,6 +71,16 @@ def test_generate_feed_slug():
     assert generate_feed_slug("  Team // Updates   Daily  ") == "team-updates-daily"
 
 
+def test_generate_feed_slug_is_cached():
+    """Test repeated feed slug lookups are served from the cache"""
+    generate_feed_slug.cache_clear()
+    assert generate_feed_slug("Cached Feed") == "cached-feed"
+    assert generate_feed_slug("Cached Feed") == "cached-feed"
+    cache_info = generate_feed_slug.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+
 def test_create_rss_feed():
     """Test RSS feed creation"""
     articles = [
@@ -126,6 +158,90 @@ def test_create_rss_feed_with_source():
     assert items[0].find("source").text == "Test Source Feed"
 
 
+def test_create_rss_feed_with_empty_source():
+    """Test a source key without a value still produces a source element"""
+    articles = [
+        {
+            "title": "Test Article",
+            "link": "https://example.com/article",
+            "published": "2026-01-10T12:00:00Z",
+            "source": None,
+        },
+        {
+            "title": "Article without source",
+            "link": "https://example.com/other",
+            "published": "2026-01-09T12:00:00Z",
+        },
+    ]
+
+    rss_xml = create_rss_feed(
+        title="Test Feed",
+        link="https://example.com/feed.xml",
+        description="Test feed description",
+        articles=articles,
+        last_build_date="2026-01-10T12:00:00Z",
+        generator_name="DevOps Feed Hub RSS Generator",
+    )
+
+    items = ET.fromstring(rss_xml).find("channel").findall("item")
+    assert items[0].find("source") is not None
+    assert items[0].find("source").text is None
+    assert items[1].find("source") is None
+
+
+def test_create_rss_feed_output_is_canonical():
+    """Test RSS feed output stays byte-for-byte identical to the pinned form"""
+    articles = [
+        {
+            "title": "Tips & Tricks <2026>",
+            "link": "https://example.com/a?x=1&y=2",
+            "published": "2026-01-10T12:00:00Z",
+            "source": 'Feed "A"',
+        },
+        {
+            "title": "",
+            "link": "",
+            "published": "Unknown",
+        },
+    ]
+
+    rss_xml = create_rss_feed(
+        title="Test Feed",
+        link='https://example.com/feed.xml?a="1"&b=2',
+        description="Test feed description",
+        articles=articles,
+        last_build_date="2026-01-10T12:00:00Z",
+        generator_name="DevOps Feed Hub RSS Generator",
+    )
+
+    assert rss_xml == (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">\n'
+        "  <channel>\n"
+        "    <title>Test Feed</title>\n"
+        '    <link>https://example.com/feed.xml?a="1"&amp;b=2</link>\n'
+        "    <description>Test feed description</description>\n"
+        '    <atom:link href="https://example.com/feed.xml?a=&quot;1&quot;&amp;b=2"'
+        ' rel="self" type="application/rss+xml" />\n'
+        "    <lastBuildDate>Sat, 10 Jan 2026 12:00:00 +0000</lastBuildDate>\n"
+        "    <generator>DevOps Feed Hub RSS Generator</generator>\n"
+        "    <item>\n"
+        "      <title>Tips &amp; Tricks &lt;2026&gt;</title>\n"
+        "      <link>https://example.com/a?x=1&amp;y=2</link>\n"
+        '      <guid isPermaLink="true">https://example.com/a?x=1&amp;y=2</guid>\n'
+        "      <pubDate>Sat, 10 Jan 2026 12:00:00 +0000</pubDate>\n"
+        '      <source>Feed "A"</source>\n'
+        "    </item>\n"
+        "    <item>\n"
+        "      <title />\n"
+        "      <link />\n"
+        '      <guid isPermaLink="true" />\n'
+        "    </item>\n"
+        "  </channel>\n"
+        "</rss>"
+    )
+
+
 def test_generate_master_feed():
     """Test master feed generation"""
     data = {
@@ -158,21 +274,22 @@ def test_generate_master_feed():
     channel = root.find("channel")
 
     # Check title
-    assert "All Articles" in channel.find("title").text
+    assert "All Articles" in channel.findtext("title")
 
     # Check items - should have all articles from all feeds
-    items = channel.findall("item")
-    assert len(items) == 2
+    items = root.iter("item")
+    first = next(items)
+    second = next(items)
+    assert next(items, None) is None
 
     # Check that source is included in items
-    sources = [item.find("source").text for item in items]
-    assert "Feed A" in sources
-    assert "Feed B" in sources
+    sources = {first.findtext("source"), second.findtext("source")}
+    assert sources == {"Feed A", "Feed B"}
 
     # Check that articles are sorted by date (newest first)
     # B1 (11:00) should come before A1 (10:00)
-    assert items[0].find("title").text == "Article B1"
-    assert items[1].find("title").text == "Article A1"
+    assert first.findtext("title") == "Article B1"
+    assert second.findtext("title") == "Article A1"
 
 
 def test_generate_master_feed_uses_site_metadata():
@@ -245,13 +362,13 @@ def test_generate_individual_feed():
     channel = root.find("channel")
 
     # Check title includes feed name
-    assert "Test Feed" in channel.find("title").text
+    assert "Test Feed" in channel.findtext("title")
 
     # Check items are sorted (newest first)
-    items = channel.findall("item")
-    assert len(items) == 2
-    assert items[0].find("title").text == "Article 2"  # 11:00 is newer
-    assert items[1].find("title").text == "Article 1"  # 10:00 is older
+    items = root.iter("item")
+    assert next(items).findtext("title") == "Article 2"  # 11:00 is newer
+    assert next(items).findtext("title") == "Article 1"  # 10:00 is older
+    assert next(items, None) is None
 
 
 def test_generate_individual_feed_uses_site_metadata():
@@ -333,16 +450,38 @@ def test_generate_all_feeds():
         assert os.path.exists(feed_b_path)
 
         # Verify master feed content
-        with open(master_feed_path, "r", encoding="utf-8") as f:
-            master_content = f.read()
-            assert "Article A1" in master_content
-            assert "Article B1" in master_content
+        master_content = Path(master_feed_path).read_bytes()
+        assert master_content.startswith(b'<?xml version="1.0" encoding="UTF-8"?>')
+        assert b"Article A1" in master_content
+        assert b"Article B1" in master_content
 
         # Verify individual feed content
-        with open(feed_a_path, "r", encoding="utf-8") as f:
-            feed_a_content = f.read()
-            assert "Article A1" in feed_a_content
-            assert "Article B1" not in feed_a_content
+        feed_a_content = Path(feed_a_path).read_bytes()
+        assert b"Article A1" in feed_a_content
+        assert b"Article B1" not in feed_a_content
+
+        # Feeds are renamed into place, readable, without leftover temp files
+        assert not [name for name in os.listdir(tmpdir) if name.endswith(".tmp")]
+        assert os.stat(master_feed_path).st_mode & 0o777 == 0o644
+
+
+def test_generate_all_feeds_failed_write_keeps_previous_feed():
+    """Test that a failed feed write leaves the previously published feed intact"""
+    data = {
+        "metadata": {"collected_at": "2026-01-10T12:00:00Z"},
+        "feeds": {"Test Feed A": {"articles": []}},
+    }
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        master_feed_path = Path(tmpdir, "feed.xml")
+        master_feed_path.write_bytes(b"previous")
+
+        with patch("utils.os.write", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                generate_all_feeds(data, tmpdir)
+
+        assert master_feed_path.read_bytes() == b"previous"
+        assert not [name for name in os.listdir(tmpdir) if name.endswith(".tmp")]
 
 
 def test_rss_feed_handles_unknown_dates():
@@ -383,6 +522,37 @@ def test_rss_feed_handles_unknown_dates():
     assert items[1].find("pubDate") is None
 
 
+def test_generate_individual_feed_sorts_mixed_dates():
+    """Test undated, offset-less and UTC articles sort together newest first"""
+    feed_data = {
+        "articles": [
+            {"title": "Undated", "link": "https://example.com/1", "published": ""},
+            {
+                "title": "Unknown",
+                "link": "https://example.com/2",
+                "published": "Unknown",
+            },
+            {
+                "title": "Naive",
+                "link": "https://example.com/3",
+                "published": "2026-01-09T12:00:00",
+            },
+            {
+                "title": "UTC",
+                "link": "https://example.com/4",
+                "published": "2026-01-10T12:00:00Z",
+            },
+        ],
+    }
+
+    rss_xml = generate_individual_feed(
+        "Mixed Feed", feed_data, "2026-01-10T12:00:00Z", "https://example.com"
+    )
+
+    titles = [item.findtext("title") for item in ET.fromstring(rss_xml).iter("item")]
+    assert titles == ["UTC", "Naive", "Undated", "Unknown"]
+
+
 def test_rss_feed_xml_declaration():
     """Test that RSS feed has proper XML declaration"""
     articles = [
@@ -493,3 +663,71 @@ def test_main_generates_feeds_with_site_metadata_file():
 
         assert "Platform Feed Hub - All Articles" in master_feed
         assert "Platform Feed Hub - Test Feed" in individual_feed
+
+
+def _benchmark_articles(count):
+    """Build a list of articles for benchmark tests"""
+    return [
+        {
+            "title": f"Article {index} & <friends>",
+            "link": f"https://example.com/articles/{index}",
+            "published": f"2026-01-{index % 28 + 1:02d}T10:00:00Z",
+            "source": f"Feed {index % 5}",
+        }
+        for index in range(count)
+    ]
+
+
+def _assert_mean_below(benchmark, seconds):
+    """Assert the benchmarked mean stays under a generous time budget"""
+    # Stats are unavailable when benchmarking is disabled (e.g. under xdist)
+    if benchmark.stats is not None:
+        assert benchmark.stats.stats.mean < seconds
+
+
+def test_bench_create_rss_feed(benchmark):
+    """Guard create_rss_feed throughput for a 100-article feed"""
+    articles = _benchmark_articles(100)
+
+    result = benchmark.pedantic(
+        create_rss_feed,
+        kwargs={
+            "title": "Benchmark Feed",
+            "link": "https://example.com/feed.xml",
+            "description": "Benchmark feed description",
+            "articles": articles,
+            "last_build_date": "2026-01-10T12:00:00Z",
+            "generator_name": "DevOps Feed Hub RSS Generator",
+        },
+        rounds=20,
+        iterations=5,
+    )
+
+    assert result.count("<item>") == 100
+    _assert_mean_below(benchmark, 0.025)
+
+
+def test_bench_parse_iso_timestamp(benchmark):
+    """Guard parse_iso_timestamp throughput"""
+    result = benchmark.pedantic(
+        parse_iso_timestamp,
+        args=("2026-01-10T12:00:00Z",),
+        rounds=20,
+        iterations=1000,
+    )
+
+    assert result.year == 2026
+    _assert_mean_below(benchmark, 0.00005)
+
+
+def test_bench_generate_feed_slug(benchmark):
+    """Guard uncached generate_feed_slug throughput"""
+    result = benchmark.pedantic(
+        generate_feed_slug.__wrapped__,
+        args=("  Microsoft // DevOps   Blog  ",),
+        rounds=20,
+        iterations=1000,
+    )
+
+    assert result == "microsoft-devops-blog"
+    _assert_mean_below(benchmark, 0.0002)
@@ -4,16 +4,21 @@ Unit tests for generate_summary.py
 Tests the summary generation functionality for RSS feed collection
 """
 
-# pylint: disable=wrong-import-position,too-many-lines
+# pylint: disable=too-many-lines
+import copy
+import io
 import json
+import mmap
 import os
+import re
 import tempfile
 import unittest
+from unittest.mock import patch
 
-# pylint: disable=wrong-import-position
-# flake8: noqa: E402
 # Import the functions we want to test
 from generate_summary import (
+    TEMPLATE_PATH,
+    _build_nav_skeleton,
     generate_all_pages,
     generate_feed_articles_content,
     generate_feed_nav,
@@ -21,32 +26,187 @@ from generate_summary import (
     generate_html_page,
     generate_markdown_summary,
     get_static_site_dir,
-    get_template_path,
     inject_website_urls,
+    load_template,
+    truncate_title,
+    write_html_page,
+    write_markdown_summary,
 )
 from utils import DEFAULT_SITE_METADATA
 
-TEMPLATE_PATH = get_template_path()
+CUSTOM_TEMPLATE_HTML = """<!doctype html>
+<html>
+<head><title>Custom Template</title></head>
+<body>
+<!-- CONTENT_PLACEHOLDER -->
+<footer>Updated: <!-- TIMESTAMP_PLACEHOLDER --></footer>
+</body>
+</html>"""
+
+# Template with UTF-8 characters
+UTF8_TEMPLATE_HTML = """<!doctype html>
+<html>
+<head><title>Test 🌙☀️</title></head>
+<body>
+<!-- CONTENT_PLACEHOLDER -->
+<footer><!-- TIMESTAMP_PLACEHOLDER --></footer>
+</body>
+</html>"""
+
+
+def _ordered_pattern(*fragments):
+    """Compile literal fragments into one pattern matching them in order."""
+    return re.compile(".*?".join(map(re.escape, fragments)), re.DOTALL)
+
+
+ARTICLE_RE = re.compile(r'class="article-item" data-published=')
+BLOG_NAME_RE = re.compile(r">([A-Za-z ]+ Blog)<")
+# Any option tag with a selected attribute, in all its variations
+SELECTED_OPTION_RE = re.compile(r"<option[^>]*\sselected[\s>=]", re.IGNORECASE)
+
+
+def missing_from_file(path, fragments):
+    """Return the fragments not found in a generated file.
+
+    The file is memory-mapped and searched as UTF-8 bytes, so large pages are
+    never decoded into a str just to run substring checks.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return [
+            fragment for fragment in fragments if mm.find(fragment.encode("utf-8")) < 0
+        ]
+
+
+def count_articles(html):
+    """Count rendered article items in an HTML page."""
+    return sum(1 for _ in ARTICLE_RE.finditer(html))
+
+
+# Markdown summary sections, which must appear in this order
+MARKDOWN_SECTIONS_PATTERN = _ordered_pattern(
+    "# 📰 DevOps Feed Hub Summary",
+    "## 📊 Summary",
+    "## ✅ Successful Feeds",
+    "## ❌ Failed Feeds",
+)
+
+# Fragments the rendered markdown and pages must contain, in any order
+EXPECTED_IN_MARKDOWN_SUMMARY = (
+    "Collected at:",
+    "Time range:** Last 24 hours",
+    "Total feeds:** 3",
+    "Successful:** 2",
+    "Failed:** 1",
+    "Total articles:** 5",
+)
+EXPECTED_IN_HTML_PAGE = (
+    "<!doctype html>",
+    '<html lang="en"',
+    "DevOps Feed Hub",
+    "</html>",
+)
+EXPECTED_SUMMARY_STATS = (
+    ">3</div>",  # total_feeds
+    ">2</div>",  # successful_feeds
+    ">1</div>",  # failed_feeds
+    ">5</div>",  # total_articles
+)
+EXPECTED_RESPONSIVE_HTML = (
+    'name="viewport"',
+    "width=device-width",
+    # CSS is external with a cache-busting version parameter
+    'link rel="stylesheet" href="styles.css?v=',
+)
+EXPECTED_DARK_MODE_HTML = (
+    "data-theme",
+    "theme-toggle",
+    'aria-label="Toggle theme"',
+    "<svg",
+    'id="theme-icon"',
+    'script src="script.js"',
+)
+
+# Fragments the default and empty-feed pages must contain
+EXPECTED_IN_DEFAULT_HTML = (
+    "Test Blog 1",
+    "Test Blog 2",
+    "Article 1",
+    "Another Article",
+    "https://example.com/article1",
+    "https://example.com/article4",
+)
+EXPECTED_IN_EMPTY_HTML = (
+    "<!doctype html>",
+    "DevOps Feed Hub",
+    "0 articles",  # Shown in the article count badge
+    "No new articles",
+)
+
+# Collection metadata shared by every sample (read-only)
+SAMPLE_METADATA = {
+    "collected_at": "2024-01-15T10:30:00Z",
+    "since": "2024-01-14T10:30:00Z",
+    "hours": 24,
+}
+
+# Custom branding used by the site metadata tests (read-only)
+CUSTOM_SITE_METADATA = {
+    "site_name": "Platform Feed Hub",
+    "site_description": "Curated platform engineering news",
+    "header_title": "Platform Feed Hub",
+    "rss_title": "Platform Feed Hub - All Articles",
+    "rss_description": "Aggregated platform engineering news",
+    "rss_generator": "Platform Feed Hub RSS Generator",
+    "summary_markdown_title": "# 📰 Platform Feed Hub Summary",
+    "settings_title": "Settings - Platform Feed Hub",
+    "settings_description": (
+        "Platform Feed Hub Settings - Configure your RSS feed preferences"
+    ),
+}
+
+
+def make_sample(feeds, failed=()):
+    """Build collection data around the given feeds, deriving the summary counts."""
+    failed_feeds = list(failed)
+    return {
+        "metadata": SAMPLE_METADATA,
+        "summary": {
+            "total_feeds": len(feeds) + len(failed_feeds),
+            "successful_feeds": len(feeds),
+            "failed_feeds": len(failed_feeds),
+            "total_articles": sum(feed["count"] for feed in feeds.values()),
+        },
+        "feeds": feeds,
+        "failed_feeds": failed_feeds,
+    }
+
+
+# Minimal single-feed collection shared by the integration tests (read-only)
+INTEGRATION_SAMPLE_DATA = make_sample(
+    {
+        "Test Feed": {
+            "url": "https://example.com/feed",
+            "count": 1,
+            "articles": [
+                {
+                    "title": "Test Article",
+                    "link": "https://example.com/article",
+                    "published": "2024-01-15T09:00:00Z",
+                }
+            ],
+        }
+    }
+)
 
 
 class TestGenerateSummary(unittest.TestCase):
     """Test cases for summary generation functions"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.sample_data = {
-            "metadata": {
-                "collected_at": "2024-01-15T10:30:00Z",
-                "since": "2024-01-14T10:30:00Z",
-                "hours": 24,
-            },
-            "summary": {
-                "total_feeds": 3,
-                "successful_feeds": 2,
-                "failed_feeds": 1,
-                "total_articles": 5,
-            },
-            "feeds": {
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared read-only test data"""
+        cls.sample_data = make_sample(
+            {
                 "Test Blog 1": {
                     "url": "https://example.com/feed1",
                     "count": 3,
@@ -85,45 +245,45 @@ class TestGenerateSummary(unittest.TestCase):
                     ],
                 },
             },
-            "failed_feeds": [
-                {"name": "Failed Feed", "url": "https://example.com/failed"}
-            ],
-        }
+            failed=[{"name": "Failed Feed", "url": "https://example.com/failed"}],
+        )
 
-        self.empty_data = {
-            "metadata": {
-                "collected_at": "2024-01-15T10:30:00Z",
-                "since": "2024-01-14T10:30:00Z",
-                "hours": 24,
-            },
-            "summary": {
-                "total_feeds": 1,
-                "successful_feeds": 1,
-                "failed_feeds": 0,
-                "total_articles": 0,
-            },
-            "feeds": {
+        cls.empty_data = make_sample(
+            {
                 "Empty Feed": {
                     "url": "https://example.com/empty",
                     "count": 0,
                     "articles": [],
                 }
-            },
-            "failed_feeds": [],
-        }
-        self.site_metadata = {
-            "site_name": "Platform Feed Hub",
-            "site_description": "Curated platform engineering news",
-            "header_title": "Platform Feed Hub",
-            "rss_title": "Platform Feed Hub - All Articles",
-            "rss_description": "Aggregated platform engineering news",
-            "rss_generator": "Platform Feed Hub RSS Generator",
-            "summary_markdown_title": "# 📰 Platform Feed Hub Summary",
-            "settings_title": "Settings - Platform Feed Hub",
-            "settings_description": (
-                "Platform Feed Hub Settings - Configure your RSS feed preferences"
-            ),
-        }
+            }
+        )
+        cls.site_metadata = CUSTOM_SITE_METADATA
+        # Pages rendered once and shared by the read-only assertions below
+        cls.default_html = generate_html_page(cls.sample_data)
+        cls.empty_html = generate_html_page(cls.empty_data)
+        cls.summary_html = generate_html_page(cls.sample_data, current_feed="summary")
+
+        # Custom templates are written once for the whole class
+        # pylint: disable-next=consider-using-with
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls._custom_template_path = os.path.join(cls._tmpdir.name, "custom.html")
+        cls._utf8_template_path = os.path.join(cls._tmpdir.name, "utf8.html")
+        for path, content in (
+            (cls._custom_template_path, CUSTOM_TEMPLATE_HTML),
+            (cls._utf8_template_path, UTF8_TEMPLATE_HTML),
+        ):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared template directory"""
+        cls._tmpdir.cleanup()
+
+    def _assert_all_in(self, text, fragments):
+        """Assert that every fragment occurs in text, reporting all missing ones"""
+        missing = [fragment for fragment in fragments if fragment not in text]
+        self.assertFalse(missing, f"missing fragments: {missing}")
 
     def test_generate_markdown_summary_basic(self):
         """Test basic markdown summary generation"""
@@ -132,36 +292,25 @@ class TestGenerateSummary(unittest.TestCase):
         # Check that result is a string
         self.assertIsInstance(result, str)
 
-        # Check for key sections
-        self.assertIn("# 📰 DevOps Feed Hub Summary", result)
-        self.assertIn("## 📊 Summary", result)
-        self.assertIn("## ✅ Successful Feeds", result)
-        self.assertIn("## ❌ Failed Feeds", result)
-
-        # Check for metadata
-        self.assertIn("Collected at:", result)
-        self.assertIn("Time range:** Last 24 hours", result)
-
-        # Check for summary stats
-        self.assertIn("Total feeds:** 3", result)
-        self.assertIn("Successful:** 2", result)
-        self.assertIn("Failed:** 1", result)
-        self.assertIn("Total articles:** 5", result)
+        # Check for key sections in order, then metadata and summary stats
+        self.assertRegex(result, MARKDOWN_SECTIONS_PATTERN)
+        self._assert_all_in(result, EXPECTED_IN_MARKDOWN_SUMMARY)
 
     def test_generate_markdown_summary_feed_content(self):
         """Test that feed content is included in markdown"""
         result = generate_markdown_summary(self.sample_data)
 
-        # Check for feed names
-        self.assertIn("Test Blog 1", result)
-        self.assertIn("Test Blog 2", result)
-
-        # Check for article titles
-        self.assertIn("Article 1", result)
-        self.assertIn("Another Article", result)
-
-        # Check for failed feed
-        self.assertIn("Failed Feed", result)
+        # Check for feed names, article titles, and the failed feed
+        self._assert_all_in(
+            result,
+            (
+                "Test Blog 1",
+                "Test Blog 2",
+                "Article 1",
+                "Another Article",
+                "Failed Feed",
+            ),
+        )
 
     def test_generate_markdown_summary_empty_feeds(self):
         """Test markdown generation with empty feeds"""
@@ -180,38 +329,22 @@ class TestGenerateSummary(unittest.TestCase):
 
     def test_generate_html_page_basic(self):
         """Test basic HTML page generation"""
-        result = generate_html_page(self.sample_data)
+        result = self.default_html
 
         # Check that result is a string
         self.assertIsInstance(result, str)
 
-        # Check for HTML structure
-        self.assertIn("<!doctype html>", result)
-        self.assertIn(
-            '<html lang="en"', result
-        )  # Updated to allow for data-theme attribute
-        self.assertIn("</html>", result)
-
-        # Check for key sections - no emojis in new design
-        self.assertIn("DevOps Feed Hub", result)
+        # Check for HTML structure and site name - no emojis in new design
+        self._assert_all_in(result, EXPECTED_IN_HTML_PAGE)
         # The new design doesn't have h1/h2 headers with emojis on the main page
         # Instead it has feed sections with h3 headers
 
     def test_generate_html_page_content(self):
         """Test that HTML page includes all content"""
-        result = generate_html_page(self.sample_data)
-
-        # Check for feed names
-        self.assertIn("Test Blog 1", result)
-        self.assertIn("Test Blog 2", result)
-
-        # Check for article titles
-        self.assertIn("Article 1", result)
-        self.assertIn("Another Article", result)
+        result = self.default_html
 
-        # Check for article links
-        self.assertIn("https://example.com/article1", result)
-        self.assertIn("https://example.com/article4", result)
+        # Check for feed names, article titles, and article links
+        self._assert_all_in(result, EXPECTED_IN_DEFAULT_HTML)
 
         # Failed feeds are now on the summary page, not a separate failed-feeds.html page
         self.assertNotIn('href="failed-feeds.html"', result)
@@ -220,42 +353,35 @@ class TestGenerateSummary(unittest.TestCase):
 
     def test_generate_html_page_stats(self):
         """Test that HTML page includes correct statistics on summary page"""
-        result = generate_html_page(self.sample_data, current_feed="summary")
+        result = self.summary_html
 
         # Check for stats values on summary page
-        self.assertIn(">3</div>", result)  # total_feeds
-        self.assertIn(">2</div>", result)  # successful_feeds
-        self.assertIn(">1</div>", result)  # failed_feeds
-        self.assertIn(">5</div>", result)  # total_articles
+        self._assert_all_in(result, EXPECTED_SUMMARY_STATS)
 
     def test_generate_summary_page_does_not_emit_python_comments(self):
         """Test that summary page HTML does not include stray source comments."""
-        result = generate_html_page(self.sample_data, current_feed="summary")
+        result = self.summary_html
 
         self.assertNotIn("# noqa", result)
 
     def test_generate_html_page_responsive(self):
         """Test that HTML page includes responsive design"""
-        result = generate_html_page(self.sample_data)
+        result = self.default_html
 
-        # Check for viewport meta tag
-        self.assertIn('name="viewport"', result)
-        self.assertIn("width=device-width", result)
+        # Check for viewport meta tag and external stylesheet
+        self._assert_all_in(result, EXPECTED_RESPONSIVE_HTML)
 
-        # CSS is now external with cache-busting version parameter
-        self.assertIn('link rel="stylesheet" href="styles.css?v=', result)
+    def test_stylesheet_link_uses_cache_version(self):
+        """Test that the stylesheet link gets the epoch cache-busting version"""
+        # 2024-01-15T10:30:00Z
+        self.assertIn('href="styles.css?v=1705314600"', self.default_html)
 
     def test_generate_html_page_empty_feeds(self):
         """Test HTML generation with empty feeds"""
-        result = generate_html_page(self.empty_data)
+        result = self.empty_html
 
-        # Should still have basic structure
-        self.assertIn("<!doctype html>", result)
-        self.assertIn("DevOps Feed Hub", result)
-
-        # Should indicate no articles (shown in article count badge)
-        self.assertIn("0 articles", result)
-        self.assertIn("No new articles", result)
+        # Should still have basic structure and indicate no articles
+        self._assert_all_in(result, EXPECTED_IN_EMPTY_HTML)
 
         # Should not have failed feeds section on main page (no emojis)
         self.assertNotIn("<h2>Failed Feeds</h2>", result)
@@ -314,7 +440,7 @@ class TestGenerateSummary(unittest.TestCase):
     def test_html_escaping(self):
         """Test that special characters are properly escaped in HTML"""
         # Create data with special characters that need escaping
-        special_data = self.sample_data.copy()
+        special_data = copy.deepcopy(self.sample_data)
         special_data["feeds"] = {
             "Test Blog <script>": {
                 "url": "https://example.com/feed",
@@ -341,7 +467,7 @@ class TestGenerateSummary(unittest.TestCase):
 
     def test_long_article_title_truncation(self):
         """Test that long article titles are truncated in markdown"""
-        long_title_data = self.sample_data.copy()
+        long_title_data = copy.deepcopy(self.sample_data)
         long_title = "A" * 100  # 100 character title
         long_title_data["feeds"]["Test Blog 1"]["articles"][0]["title"] = long_title
 
@@ -350,10 +476,17 @@ class TestGenerateSummary(unittest.TestCase):
         # Should be truncated with ellipsis
         self.assertIn("...", result)
 
+    def test_truncate_title(self):
+        """Test title truncation at the markdown table limit"""
+        self.assertEqual(truncate_title("A" * 100), "A" * 80 + "...")
+        self.assertEqual(truncate_title("A" * 80), "A" * 80)
+        self.assertEqual(truncate_title("Short title"), "Short title")
+        self.assertEqual(truncate_title("abcdef", limit=3), "abc...")
+
     def test_multiple_articles_display_limit(self):
         """Test that markdown limits article display to 10 per feed"""
         # Create data with more than 10 articles
-        many_articles_data = self.sample_data.copy()
+        many_articles_data = copy.deepcopy(self.sample_data)
         articles = [
             {
                 "title": f"Article {i}",
@@ -373,41 +506,23 @@ class TestGenerateSummary(unittest.TestCase):
     def test_template_file_loading(self):
         """Test that template file is loaded correctly"""
         # This should work with default template
-        result = generate_html_page(self.sample_data)
+        result = self.default_html
 
-        # Check that template elements are present
-        self.assertIn("<!doctype html>", result)
-        self.assertIn('<html lang="en"', result)
-        self.assertIn("data-theme=", result)  # Dark mode attribute
+        # Check that template elements are present, including the dark mode attribute
+        self._assert_all_in(
+            result, ("<!doctype html>", '<html lang="en"', "data-theme=")
+        )
 
     def test_template_with_custom_path(self):
         """Test HTML generation with custom template path"""
-        # Create a custom template
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".html", encoding="utf-8"
-        ) as f:
-            custom_template = f.name
-            f.write("""<!doctype html>
-<html>
-<head><title>Custom Template</title></head>
-<body>
-<!-- CONTENT_PLACEHOLDER -->
-<footer>Updated: <!-- TIMESTAMP_PLACEHOLDER --></footer>
-</body>
-</html>""")
+        result = generate_html_page(self.sample_data, self._custom_template_path)
 
-        try:
-            result = generate_html_page(self.sample_data, custom_template)
+        # Check custom template elements
+        self.assertIn("Custom Template", result)
+        self.assertIn("<footer>Updated:", result)
 
-            # Check custom template elements
-            self.assertIn("Custom Template", result)
-            self.assertIn("<footer>Updated:", result)
-
-            # Check that content was injected
-            self.assertIn("Test Blog 1", result)
-        finally:
-            if os.path.exists(custom_template):
-                os.remove(custom_template)
+        # Check that content was injected
+        self.assertIn("Test Blog 1", result)
 
     def test_template_file_not_found(self):
         """Test error handling when template file doesn't exist"""
@@ -418,194 +533,108 @@ class TestGenerateSummary(unittest.TestCase):
         self.assertIn("not found", str(context.exception).lower())
         self.assertIn("template", str(context.exception).lower())
 
+    def test_template_read_is_cached(self):
+        """Test that repeated template loads reuse the cached content"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            template_path = os.path.join(tmpdir, "template.html")
+            with open(template_path, "w", encoding="utf-8") as f:
+                f.write("<p>cached</p>")
+
+            with patch("builtins.open", wraps=open) as mock_open:
+                self.assertEqual(load_template(template_path), "<p>cached</p>")
+                self.assertEqual(load_template(template_path), "<p>cached</p>")
+
+            mock_open.assert_called_once()
+
+    def test_template_cache_invalidated_on_change(self):
+        """Test that a modified template is read again instead of served stale"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            template_path = os.path.join(tmpdir, "template.html")
+            with open(template_path, "w", encoding="utf-8") as f:
+                f.write("<p>first</p>")
+            self.assertEqual(load_template(template_path), "<p>first</p>")
+
+            with open(template_path, "w", encoding="utf-8") as f:
+                f.write("<p>second version</p>")
+            self.assertEqual(load_template(template_path), "<p>second version</p>")
+
     def test_template_utf8_encoding(self):
         """Test that template handles UTF-8 characters correctly"""
-        # Create template with UTF-8 characters
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".html", encoding="utf-8"
-        ) as f:
-            utf8_template = f.name
-            f.write("""<!doctype html>
-<html>
-<head><title>Test 🌙☀️</title></head>
-<body>
-<!-- CONTENT_PLACEHOLDER -->
-<footer><!-- TIMESTAMP_PLACEHOLDER --></footer>
-</body>
-</html>""")
+        result = generate_html_page(self.sample_data, self._utf8_template_path)
 
-        try:
-            result = generate_html_page(self.sample_data, utf8_template)
-
-            # Check UTF-8 characters are preserved
-            self.assertIn("🌙", result)
-            self.assertIn("☀️", result)
-        finally:
-            if os.path.exists(utf8_template):
-                os.remove(utf8_template)
+        # Check UTF-8 characters are preserved
+        self.assertIn("🌙", result)
+        self.assertIn("☀️", result)
 
     def test_dark_mode_elements(self):
         """Test that dark mode toggle elements are present"""
-        result = generate_html_page(self.sample_data)
-
-        # Check for dark mode toggle button
-        self.assertIn("theme-toggle", result)
-        self.assertIn('aria-label="Toggle theme"', result)
+        result = self.default_html
 
-        # Check for SVG icons (new design uses SVG, not emoji)
-        self.assertIn("<svg", result)
-        self.assertIn('id="theme-icon"', result)
-
-        # Check for theme script (external JS file)
-        self.assertIn('script src="script.js"', result)
-        self.assertIn("data-theme", result)
+        # Check for toggle button, SVG icons (not emoji), and external theme script
+        self._assert_all_in(result, EXPECTED_DARK_MODE_HTML)
 
     def test_placeholder_replacement(self):
         """Test that placeholders are correctly replaced"""
-        result = generate_html_page(self.sample_data)
+        result = self.default_html
 
         # Placeholders should be replaced
         self.assertNotIn("<!-- CONTENT_PLACEHOLDER -->", result)
         self.assertNotIn("<!-- TIMESTAMP_PLACEHOLDER -->", result)
 
-        # Content should be present
-        self.assertIn("Test Blog 1", result)
-
-        # Timestamp should be formatted correctly
-        self.assertIn("January", result)
-        self.assertIn("2024", result)
-        self.assertIn("UTC", result)
+        # Content should be present and the timestamp formatted correctly
+        self._assert_all_in(result, ("Test Blog 1", "January", "2024", "UTC"))
 
 
 class TestSummaryIntegration(unittest.TestCase):
     """Integration tests for summary generation"""
 
-    def test_write_markdown_to_file(self):
-        """Test writing markdown summary to a file"""
-        sample_data = {
-            "metadata": {
-                "collected_at": "2024-01-15T10:30:00Z",
-                "since": "2024-01-14T10:30:00Z",
-                "hours": 24,
-            },
-            "summary": {
-                "total_feeds": 1,
-                "successful_feeds": 1,
-                "failed_feeds": 0,
-                "total_articles": 1,
-            },
-            "feeds": {
-                "Test Feed": {
-                    "url": "https://example.com/feed",
-                    "count": 1,
-                    "articles": [
-                        {
-                            "title": "Test Article",
-                            "link": "https://example.com/article",
-                            "published": "2024-01-15T09:00:00Z",
-                        }
-                    ],
-                }
-            },
-            "failed_feeds": [],
-        }
+    @classmethod
+    def setUpClass(cls):
+        """Create one output directory shared by the write tests"""
+        # pylint: disable-next=consider-using-with
+        cls._tmpdir = tempfile.TemporaryDirectory()
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".md", encoding="utf-8"
-        ) as f:
-            markdown_file = f.name
-
-        try:
-            markdown_content = generate_markdown_summary(sample_data)
-            with open(markdown_file, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared output directory"""
+        cls._tmpdir.cleanup()
 
-            # Verify file was written
-            self.assertTrue(os.path.exists(markdown_file))
-
-            # Verify content
-            with open(markdown_file, "r", encoding="utf-8") as f:
-                content = f.read()
+    def test_write_markdown_to_file(self):
+        """Test writing markdown summary to a file"""
+        markdown_content = generate_markdown_summary(INTEGRATION_SAMPLE_DATA)
+        markdown_file = os.path.join(self._tmpdir.name, "summary.md")
+        with open(markdown_file, "w", encoding="utf-8") as f:
+            write_markdown_summary(f, INTEGRATION_SAMPLE_DATA)
 
-            self.assertIn("Test Feed", content)
-            self.assertIn("Test Article", content)
-        finally:
-            if os.path.exists(markdown_file):
-                os.remove(markdown_file)
+        # Verify the whole summary was written, without re-reading the file
+        self.assertEqual(
+            os.path.getsize(markdown_file), len(markdown_content.encode("utf-8"))
+        )
+        self.assertIn("Test Feed", markdown_content)
+        self.assertIn("Test Article", markdown_content)
 
     def test_write_html_to_file(self):
         """Test writing HTML page to a file"""
-        sample_data = {
-            "metadata": {
-                "collected_at": "2024-01-15T10:30:00Z",
-                "since": "2024-01-14T10:30:00Z",
-                "hours": 24,
-            },
-            "summary": {
-                "total_feeds": 1,
-                "successful_feeds": 1,
-                "failed_feeds": 0,
-                "total_articles": 1,
-            },
-            "feeds": {
-                "Test Feed": {
-                    "url": "https://example.com/feed",
-                    "count": 1,
-                    "articles": [
-                        {
-                            "title": "Test Article",
-                            "link": "https://example.com/article",
-                            "published": "2024-01-15T09:00:00Z",
-                        }
-                    ],
-                }
-            },
-            "failed_feeds": [],
-        }
+        html_content = generate_html_page(INTEGRATION_SAMPLE_DATA)
+        html_file = os.path.join(self._tmpdir.name, "index.html")
+        with open(html_file, "w", encoding="utf-8") as f:
+            write_html_page(f, INTEGRATION_SAMPLE_DATA)
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".html", encoding="utf-8"
-        ) as f:
-            html_file = f.name
-
-        try:
-            html_content = generate_html_page(sample_data)
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-
-            # Verify file was written
-            self.assertTrue(os.path.exists(html_file))
-
-            # Verify content
-            with open(html_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            self.assertIn("<!doctype html>", content)
-            self.assertIn("Test Feed", content)
-            self.assertIn("Test Article", content)
-        finally:
-            if os.path.exists(html_file):
-                os.remove(html_file)
+        # Verify the whole page was written, without re-reading the file
+        self.assertEqual(os.path.getsize(html_file), len(html_content.encode("utf-8")))
+        self.assertIn("<!doctype html>", html_content)
+        self.assertIn("Test Feed", html_content)
+        self.assertIn("Test Article", html_content)
 
 
 class TestMultiPageGeneration(unittest.TestCase):
     """Test cases for multi-page generation functionality"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.sample_data = {
-            "metadata": {
-                "collected_at": "2024-01-15T10:30:00Z",
-                "since": "2024-01-14T10:30:00Z",
-                "hours": 24,
-            },
-            "summary": {
-                "total_feeds": 2,
-                "successful_feeds": 2,
-                "failed_feeds": 0,
-                "total_articles": 3,
-            },
-            "feeds": {
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared read-only test data"""
+        cls.sample_data = make_sample(
+            {
                 "Test Feed 1": {
                     "url": "https://example.com/feed1",
                     "count": 2,
@@ -633,33 +662,26 @@ class TestMultiPageGeneration(unittest.TestCase):
                         }
                     ],
                 },
-            },
-            "failed_feeds": [],
-        }
-        self.site_metadata = {
-            "site_name": "Platform Feed Hub",
-            "site_description": "Curated platform engineering news",
-            "header_title": "Platform Feed Hub",
-            "rss_title": "Platform Feed Hub - All Articles",
-            "rss_description": "Aggregated platform engineering news",
-            "rss_generator": "Platform Feed Hub RSS Generator",
-            "summary_markdown_title": "# 📰 Platform Feed Hub Summary",
-            "settings_title": "Settings - Platform Feed Hub",
-            "settings_description": (
-                "Platform Feed Hub Settings - Configure your RSS feed preferences"
-            ),
-        }
+            }
+        )
+        cls.site_metadata = CUSTOM_SITE_METADATA
+        # Pages rendered once and shared by the read-only assertions below
+        cls.default_html = generate_html_page(cls.sample_data)
+        cls.feed1_html = generate_html_page(cls.sample_data, current_feed="Test Feed 1")
 
     def test_generate_feed_slug(self):
         """Test feed slug generation"""
-        self.assertEqual(generate_feed_slug("Test Feed 1"), "test-feed-1")
-        self.assertEqual(generate_feed_slug("GitHub Blog"), "github-blog")
-        self.assertEqual(
-            generate_feed_slug("Microsoft/DevOps Blog"), "microsoft-devops-blog"
-        )
-        self.assertEqual(generate_feed_slug("Test@#$%Feed"), "testfeed")
-        self.assertEqual(generate_feed_slug("Test--Feed"), "test-feed")
-        self.assertEqual(generate_feed_slug("-Test Feed-"), "test-feed")
+        cases = [
+            ("Test Feed 1", "test-feed-1"),
+            ("GitHub Blog", "github-blog"),
+            ("Microsoft/DevOps Blog", "microsoft-devops-blog"),
+            ("Test@#$%Feed", "testfeed"),
+            ("Test--Feed", "test-feed"),
+            ("-Test Feed-", "test-feed"),
+        ]
+        for feed_name, expected in cases:
+            with self.subTest(feed_name=feed_name):
+                self.assertEqual(generate_feed_slug(feed_name), expected)
 
     def test_generate_feed_nav(self):
         """Test navigation generation"""
@@ -688,25 +710,36 @@ class TestMultiPageGeneration(unittest.TestCase):
         """Test navigation with active feed"""
         nav_html = generate_feed_nav(self.sample_data["feeds"], "Test Feed 1")
 
-        # Check that current feed has active class
-        self.assertIn('class="nav-link active"', nav_html)
-
         # Verify the active link is for the current feed
-        lines = nav_html.split("\n")
-        for line in lines:
-            # Skip the feed-list-data script tag
-            if "feed-list-data" in line:
-                continue
-            if "Test Feed 1" in line:
-                # The active class should be in the same line
-                self.assertIn("active", line)
-                break
-        else:
-            self.fail("Test Feed 1 not found in navigation")
+        self.assertRegex(nav_html, r'class="nav-link active"[^>]*>Test Feed 1</a>')
+
+    def test_generate_feed_nav_reuses_skeleton(self):
+        """Test that pages for the same feeds share one cached nav skeleton"""
+        _build_nav_skeleton.cache_clear()
+        feeds = self.sample_data["feeds"]
+
+        summary_nav = generate_feed_nav(feeds, "summary")
+        feed_nav = generate_feed_nav(feeds, "Test Feed 1")
+
+        self.assertEqual(_build_nav_skeleton.cache_info().misses, 1)
+        self.assertEqual(_build_nav_skeleton.cache_info().hits, 1)
+        self.assertEqual(summary_nav.count(" active"), 1)
+        self.assertEqual(feed_nav.count(" active"), 1)
+        self.assertIn('class="nav-link active">Summary</a>', summary_nav)
+
+    def test_generate_feed_nav_sorts_unsorted_feeds(self):
+        """Test that navigation lists feeds alphabetically whatever the data order"""
+        feeds = {"Zeta Feed": {}, "Alpha Feed": {}}
+
+        nav_html = generate_feed_nav(feeds)
+
+        self.assertLess(
+            nav_html.index(">Alpha Feed</a>"), nav_html.index(">Zeta Feed</a>")
+        )
 
     def test_generate_html_page_with_feed(self):
         """Test HTML page generation for a specific feed"""
-        result = generate_html_page(self.sample_data, current_feed="Test Feed 1")
+        result = self.feed1_html
 
         # Check that only the specified feed appears in articles
         self.assertIn("Test Feed 1", result)
@@ -715,6 +748,7 @@ class TestMultiPageGeneration(unittest.TestCase):
         # Test Feed 2's article should not appear
         self.assertIn("Test Feed 2", result)  # Will appear in navigation
         # But Article 3 should not appear in the main content area
+        self.assertNotIn("Article 3", result)
 
         # Check for navigation
         self.assertIn('class="feed-nav"', result)
@@ -725,16 +759,18 @@ class TestMultiPageGeneration(unittest.TestCase):
         # Check page title is updated
         self.assertIn("<title>Test Feed 1 - DevOps Feed Hub</title>", result)
 
-        custom_result = generate_html_page(
+    def test_generate_html_page_with_feed_uses_site_metadata(self):
+        """Test that feed page titles use custom site metadata"""
+        result = generate_html_page(
             self.sample_data,
             current_feed="Test Feed 1",
             site_metadata=self.site_metadata,
         )
-        self.assertIn("<title>Test Feed 1 - Platform Feed Hub</title>", custom_result)
+        self.assertIn("<title>Test Feed 1 - Platform Feed Hub</title>", result)
 
     def test_generate_html_page_main_index(self):
         """Test HTML page generation for main index (all feeds)"""
-        result = generate_html_page(self.sample_data)
+        result = self.default_html
 
         # Check that all feeds appear
         self.assertIn("Test Feed 1", result)
@@ -766,25 +802,92 @@ class TestMultiPageGeneration(unittest.TestCase):
             self.assertTrue(os.path.exists(feed2_path))
 
             # Verify index content
-            with open(index_path, "r", encoding="utf-8") as f:
-                index_content = f.read()
-            self.assertIn("Test Feed 1", index_content)
-            self.assertIn("Test Feed 2", index_content)
-            self.assertIn("Article 1", index_content)
-            self.assertIn("Article 3", index_content)
+            self.assertEqual(
+                missing_from_file(
+                    index_path, ("Test Feed 1", "Test Feed 2", "Article 1", "Article 3")
+                ),
+                [],
+            )
 
             # Verify feed 1 content
-            with open(feed1_path, "r", encoding="utf-8") as f:
-                feed1_content = f.read()
-            self.assertIn("Test Feed 1", feed1_content)
-            self.assertIn("Article 1", feed1_content)
-            self.assertIn("Article 2", feed1_content)
+            self.assertEqual(
+                missing_from_file(
+                    feed1_path, ("Test Feed 1", "Article 1", "Article 2")
+                ),
+                [],
+            )
 
             # Verify feed 2 content
-            with open(feed2_path, "r", encoding="utf-8") as f:
-                feed2_content = f.read()
-            self.assertIn("Test Feed 2", feed2_content)
-            self.assertIn("Article 3", feed2_content)
+            self.assertEqual(
+                missing_from_file(feed2_path, ("Test Feed 2", "Article 3")), []
+            )
+
+    def test_generate_all_pages_does_not_mutate_data(self):
+        """Test that page generation works on the input data without modifying it"""
+        snapshot = copy.deepcopy(self.sample_data)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generate_all_pages(self.sample_data, tmpdir)
+
+        self.assertEqual(self.sample_data, snapshot)
+
+    def test_generate_all_pages_leaves_no_temp_files(self):
+        """Test that pages are renamed into place without leftover temp files"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generate_all_pages(self.sample_data, tmpdir)
+
+            leftovers = [name for name in os.listdir(tmpdir) if name.endswith(".tmp")]
+            self.assertEqual(leftovers, [])
+            self.assertEqual(
+                os.stat(os.path.join(tmpdir, "index.html")).st_mode & 0o777, 0o644
+            )
+
+    def test_generate_all_pages_failure_keeps_previous_page(self):
+        """Test that a failed render leaves the previously published page intact"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index_path = os.path.join(tmpdir, "index.html")
+            with open(index_path, "w", encoding="utf-8") as f:
+                f.write("previous")
+
+            with patch(
+                "generate_summary.generate_html_content",
+                side_effect=RuntimeError("render failed"),
+            ):
+                with self.assertRaises(RuntimeError):
+                    generate_all_pages(self.sample_data, tmpdir)
+
+            with open(index_path, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "previous")
+            self.assertFalse(
+                [name for name in os.listdir(tmpdir) if name.endswith(".tmp")]
+            )
+
+    def test_generate_all_pages_breakdown_ties_are_alphabetical(self):
+        """Test that feeds with equal counts are listed alphabetically on summary.html"""
+        data = copy.deepcopy(self.sample_data)
+        data["feeds"] = dict(reversed(list(data["feeds"].items())))
+        data["feeds"]["Test Feed 1"]["count"] = data["feeds"]["Test Feed 2"]["count"]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generate_all_pages(data, tmpdir)
+            with open(os.path.join(tmpdir, "summary.html"), "r", encoding="utf-8") as f:
+                summary_content = f.read()
+
+        self.assertLess(
+            summary_content.index(
+                'href="feed-test-feed-1.html" class="feed-breakdown-name"'
+            ),
+            summary_content.index(
+                'href="feed-test-feed-2.html" class="feed-breakdown-name"'
+            ),
+        )
+
+    def test_write_html_page_streams_same_page(self):
+        """Test that streaming a page writes the same HTML as generate_html_page"""
+        out = io.StringIO()
+        write_html_page(out, self.sample_data, current_feed="Test Feed 1")
+
+        self.assertEqual(out.getvalue(), self.feed1_html)
 
     def test_generate_all_pages_creates_directory(self):
         """Test that generate_all_pages creates output directory if it doesn't exist"""
@@ -802,7 +905,7 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_feed_page_navigation_links(self):
         """Test that feed pages have correct navigation links"""
-        result = generate_html_page(self.sample_data, current_feed="Test Feed 1")
+        result = self.feed1_html
 
         # Should have links to index and other feeds
         self.assertIn('href="index.html"', result)
@@ -811,11 +914,10 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_single_feed_shows_only_its_articles(self):
         """Test that single feed page shows only articles from that feed"""
-        result = generate_html_page(self.sample_data, current_feed="Test Feed 1")
+        result = self.feed1_html
 
         # Count article items with data-published attribute - should only have 2 for Test Feed 1
-        article_count = result.count('class="article-item" data-published=')
-        self.assertEqual(article_count, 2)
+        self.assertEqual(count_articles(result), 2)
 
         # Verify correct articles are shown
         self.assertIn("Article 1", result)
@@ -823,7 +925,7 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_feed_page_title_appears_only_once(self):
         """Test that individual feed pages show the feed title exactly once (not twice)"""
-        result = generate_html_page(self.sample_data, current_feed="Test Feed 1")
+        result = self.feed1_html
 
         # The feed name should appear exactly once as an h2 heading in the content area
         h2_count = result.count("<h2>Test Feed 1")
@@ -831,7 +933,7 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_feed_page_title_escaping(self):
         """Test that feed names with special characters are escaped in page title"""
-        special_data = self.sample_data.copy()
+        special_data = copy.deepcopy(self.sample_data)
         special_data["feeds"] = {
             "Test <script>alert('XSS')</script>": {
                 "url": "https://example.com/feed",
@@ -850,7 +952,7 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_generate_feed_nav_with_failed_feeds(self):
         """Test navigation includes summary link (failed feeds now shown on summary page)"""
-        data_with_failures = self.sample_data.copy()
+        data_with_failures = copy.deepcopy(self.sample_data)
         data_with_failures["failed_feeds"] = [
             {"name": "Failed Feed", "url": "https://example.com/failed"}
         ]
@@ -871,7 +973,7 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_generate_failed_feeds_page(self):
         """Test generation of failed feeds page (now part of summary page)"""
-        data_with_failures = self.sample_data.copy()
+        data_with_failures = copy.deepcopy(self.sample_data)
         data_with_failures["failed_feeds"] = [
             {"name": "Failed Feed 1", "url": "https://example.com/failed1"},
             {"name": "Failed Feed 2", "url": "https://example.com/failed2"},
@@ -893,7 +995,7 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_generate_all_pages_with_failed_feeds(self):
         """Test that generate_all_pages includes failed feeds on summary page"""
-        data_with_failures = self.sample_data.copy()
+        data_with_failures = copy.deepcopy(self.sample_data)
         data_with_failures["failed_feeds"] = [
             {"name": "Failed Feed", "url": "https://example.com/failed"}
         ]
@@ -905,13 +1007,18 @@ class TestMultiPageGeneration(unittest.TestCase):
             summary_path = os.path.join(tmpdir, "summary.html")
             self.assertTrue(os.path.exists(summary_path))
 
-            # Verify failed feeds appear on summary page
-            with open(summary_path, "r", encoding="utf-8") as f:
-                summary_content = f.read()
-            self.assertIn("Failed Feed", summary_content)
-            self.assertIn("https://example.com/failed", summary_content)
-            # Check page title
-            self.assertIn("<title>Summary - DevOps Feed Hub</title>", summary_content)
+            # Verify failed feeds and the page title appear on summary page
+            self.assertEqual(
+                missing_from_file(
+                    summary_path,
+                    (
+                        "Failed Feed",
+                        "https://example.com/failed",
+                        "<title>Summary - DevOps Feed Hub</title>",
+                    ),
+                ),
+                [],
+            )
 
             settings_path = os.path.join(tmpdir, "settings.html")
             with open(settings_path, "r", encoding="utf-8") as file:
@@ -932,7 +1039,7 @@ class TestMultiPageGeneration(unittest.TestCase):
     def test_alphabetical_feed_ordering(self):
         """Test that feeds are displayed in alphabetical order"""
         # Create data with feeds in non-alphabetical order
-        unordered_data = self.sample_data.copy()
+        unordered_data = copy.deepcopy(self.sample_data)
         unordered_data["feeds"] = {
             "Zebra Blog": {
                 "url": "https://example.com/zebra",
@@ -971,34 +1078,19 @@ class TestMultiPageGeneration(unittest.TestCase):
 
         result = generate_html_page(unordered_data)
 
-        # Find positions of feed names in the HTML
-        apple_pos = result.find(">Apple Blog<")
-        microsoft_pos = result.find(">Microsoft Blog<")
-        zebra_pos = result.find(">Zebra Blog<")
-
-        # All should be found
-        self.assertNotEqual(apple_pos, -1)
-        self.assertNotEqual(microsoft_pos, -1)
-        self.assertNotEqual(zebra_pos, -1)
-
-        # Check they appear in alphabetical order
-        self.assertLess(apple_pos, microsoft_pos)
-        self.assertLess(microsoft_pos, zebra_pos)
+        # All feed names should be found, in alphabetical order
+        names = BLOG_NAME_RE.findall(result)
+        self.assertEqual(names, sorted(unordered_data["feeds"]))
 
     def test_template_no_hardcoded_selected_attribute(self):
         """Test that template.html does not have hardcoded selected."""
-        import re  # pylint: disable=import-outside-toplevel
-
-        # Read the template file
-        with open(TEMPLATE_PATH, "r", encoding="utf-8") as f:
-            template_content = f.read()
+        # Read the template file (shared with page rendering via the template cache)
+        template_content = load_template(TEMPLATE_PATH)
 
         # Check that there's no selected attribute in any option tag
         # This prevents the timeframe selector bug where hardcoded selected
         # prevents JavaScript from setting the correct value from localStorage
-        # Use regex to catch all variations
-        selected_pattern = re.compile(r"<option[^>]*\sselected[\s>=]", re.IGNORECASE)
-        match = selected_pattern.search(template_content)
+        match = SELECTED_OPTION_RE.search(template_content)
 
         self.assertIsNone(
             match,
@@ -1010,7 +1102,7 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_failed_feeds_with_error_reasons(self):
         """Test that failed feeds display error reasons"""
-        data_with_errors = self.sample_data.copy()
+        data_with_errors = copy.deepcopy(self.sample_data)
         data_with_errors["failed_feeds"] = [
             {
                 "name": "Broken Feed",
@@ -1033,7 +1125,7 @@ class TestMultiPageGeneration(unittest.TestCase):
 
     def test_failed_feeds_without_error_defaults_to_unknown(self):
         """Test that failed feeds without error field default to 'Unknown'"""
-        data_without_errors = self.sample_data.copy()
+        data_without_errors = copy.deepcopy(self.sample_data)
         data_without_errors["failed_feeds"] = [
             {"name": "Old Feed", "url": "https://example.com/old"}
         ]